@@ -7,6 +7,7 @@ Handles age calcs in various time units, supports both file-based and standalone
 import datetime as dt
 import re
 from collections.abc import Callable
+from functools import cached_property
 
 from ._constants import (
     DAYS_PER_MONTH,
@@ -62,6 +63,9 @@ class Age:
           calendar policies and update patterns.
     """
 
+    # "__dict__" stays in slots so cached_property has somewhere to store.
+    __slots__ = ("_start_time", "_end_time", "__dict__")
+
     def __init__(
         self,
         start_time: TimeLike,
@@ -96,37 +100,37 @@ class Age:
     # validation for start/end times. Makes future updates easier and keeps logic DRY.
 
 
-    @property
+    @cached_property
     def seconds(self) -> float:
         """Get age in seconds."""
         return (self.end_time - self.start_time).total_seconds()
 
-    @property
+    @cached_property
     def minutes(self) -> float:
         """Get age in minutes."""
         return self.seconds / SECONDS_PER_MINUTE
 
-    @property
+    @cached_property
     def hours(self) -> float:
         """Get age in hours."""
         return self.seconds / SECONDS_PER_HOUR
 
-    @property
+    @cached_property
     def days(self) -> float:
         """Get age in days."""
         return self.seconds / SECONDS_PER_DAY
 
-    @property
+    @cached_property
     def weeks(self) -> float:
         """Get age in weeks."""
         return self.days / DAYS_PER_WEEK
 
-    @property
+    @cached_property
     def months(self) -> float:
         """Get age in months (approximate - 30.44 days)."""
         return self.days / DAYS_PER_MONTH
     
-    @property
+    @cached_property
     def months_precise(self) -> float:
         """
         Get age in months (precise calculation based on calendar months).
@@ -186,7 +190,7 @@ class Age:
 
         return scale * (first_month_fraction + full_months + last_month_fraction)
 
-    @property
+    @cached_property
     def years(self) -> float:
         """
         Get age in years (approximate - 365.25 days, can be negative).
@@ -199,7 +203,7 @@ class Age:
         # Uses 365.25 days/year for approximation; does not distinguish leap/non-leap years.
         return self.days / DAYS_PER_YEAR
     
-    @property
+    @cached_property
     def years_precise(self) -> float:
         """
         Get age in years (precise calculation based on calendar years).
@@ -33,6 +33,9 @@ class Biz:
     operations and leaves policy-free calendar/time calculations to `Cal`.
     """
 
+    # "__dict__" stays in slots so the cached_property units have storage.
+    __slots__ = ("cal_policy", "_target_dt", "_ref_dt", "__dict__")
+
     def __init__(
         self,
         target_dt: TimeLike,
@@ -75,6 +78,25 @@ class Biz:
         """Return a concise representation useful for debugging."""
         return f"<Biz {self.target_dt=!r} {self.ref_dt=!r} {self.cal_policy=!r}>"
 
+    @classmethod
+    def batch(
+        cls,
+        targets: list[TimeLike],
+        ref_dt: TimeLike,
+        policy: BizPolicy | None = None,
+        formats: list[str] | None = None,
+    ) -> list["Biz"]:
+        """Build one Biz per target against a shared reference and policy.
+
+        Normalizes ``ref_dt`` once rather than re-parsing it for every target,
+        and shares a single policy (with its precomputed fiscal table, workday
+        mask, and holiday set) across all instances instead of building a
+        default policy per target.
+        """
+        shared_policy = policy or BizPolicy()
+        _, ref = time_pair(start_time=ref_dt, end_time=ref_dt, formats__=formats)
+        return [cls(target, ref, policy=shared_policy, formats=formats) for target in targets]
+
     # ---------- Properties ----------
     @property
     def holiday(self) -> bool:
@@ -202,6 +224,26 @@ class Biz:
 
     # (No in_* forwards; use unit adapters directly.)
 
+    @staticmethod
+    def fiscal_quarters(dts: list[dt.datetime], policy: BizPolicy) -> list[int]:
+        """Return the fiscal quarter for each datetime in one pass.
+
+        Batch counterpart to the per-instance `fiscal_quarter` property:
+        binds the policy's precomputed fiscal table once and runs a single
+        comprehension instead of building a Biz per datetime.
+        """
+        table = policy._fy_table
+        return [table[d.month - 1][0] for d in dts]
+
+    @staticmethod
+    def fiscal_years(dts: list[dt.datetime], policy: BizPolicy) -> list[int]:
+        """Return the fiscal year for each datetime in one pass.
+
+        Batch counterpart to the per-instance `fiscal_year` property.
+        """
+        table = policy._fy_table
+        return [d.year + table[d.month - 1][1] for d in dts]
+
     @staticmethod
     def get_fiscal_year(dt_: dt.datetime, fy_start_month: int) -> int:
         """Return the fiscal year for a given datetime and fiscal year start month."""
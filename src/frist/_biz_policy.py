@@ -26,20 +26,27 @@ class BizPolicy:
             workdays by the policy.
         - `start_of_business` / `end_of_business` (datetime.time): business hours
             used to compute fractional business/working-day values.
-        - `holidays` (set[str]): set of ISO date strings (YYYY-MM-DD) marking
-            non-business days.
+        - `holidays` (set | frozenset): ISO date strings (YYYY-MM-DD),
+            `datetime.date`, or `datetime.datetime` values marking
+            non-business days. Dates skip string parsing entirely; strings
+            are parsed once at construction.
 
         The class provides convenience methods such as `is_workday`, `is_business_day`,
         `is_holiday`, and `business_day_fraction` that encapsulate these rules. Use
         this object when calling policy-aware helpers (for example `Biz`) so you can
         centralize and test business-specific behavior in one place.
+
+        Note: `workdays`, `holidays`, and `fiscal_year_start_month` are
+        snapshotted into derived lookup tables when the policy is constructed.
+        Mutating `workdays` or `holidays` afterwards has no effect on the
+        policy's behavior; build a new `BizPolicy` instead.
     """
 
     fiscal_year_start_month: int = 1
     workdays: list[int] = field(default_factory=lambda: [0, 1, 2, 3, 4]) # Mon=0...Fri=4
     start_of_business: dt.time = dt.time(9, 0)
     end_of_business: dt.time = dt.time(17, 0)
-    holidays: set[str] = field(default_factory=set) # type: ignore[assignment]
+    holidays: set[str | dt.date] = field(default_factory=set) # type: ignore[assignment]
     
     def __post_init__(self):
         if not (1 <= self.fiscal_year_start_month <= 12):
@@ -52,8 +59,40 @@ class BizPolicy:
         for wd in self.workdays:
             if not isinstance(wd, int) or not (0 <= wd <= 6): # type: ignore # Run time type checker
                 raise ValueError(f"workdays must contain only integers 0..6, got {wd}")
-        if not isinstance(self.holidays, set): # type: ignore # Run time type checker
-            raise TypeError("holidays must be a set")
+        # frozenset is accepted as-is (callers sharing a module-level constant
+        # skip rebuilding a mutable set per policy).
+        if not isinstance(self.holidays, (set, frozenset)): # type: ignore # Run time type checker
+            raise TypeError("holidays must be a set or frozenset")
+        # (fiscal quarter, fiscal-year offset) per calendar month, precomputed
+        # once so the fiscal units index a tuple instead of doing modular
+        # arithmetic on every call.
+        s = self.fiscal_year_start_month
+        self._fy_table: tuple[tuple[int, int], ...] = tuple(
+            ((m - s) % 12 // 3 + 1, 0 if m >= s else -1) for m in range(1, 13)
+        )
+        # 7-bit workday mask (bit n set => weekday n is a workday) so
+        # is_workday is a shift+AND instead of a list membership scan.
+        mask = 0
+        for wd in self.workdays:
+            mask |= 1 << wd
+        self._workday_mask: int = mask
+        # Parse-once holiday lookup: queries hash a date object instead of
+        # formatting or parsing a string per call. Elements may be ISO strings
+        # (parsed here), dates (taken as-is), or datetimes (truncated to their
+        # date). Strings that are not valid ISO dates are skipped; they could
+        # never match a real date anyway.
+        holiday_dates = set()
+        for h in self.holidays:
+            if isinstance(h, dt.datetime):
+                holiday_dates.add(h.date())
+            elif isinstance(h, dt.date):
+                holiday_dates.add(h)
+            else:
+                try:
+                    holiday_dates.add(dt.date.fromisoformat(h))
+                except (ValueError, TypeError):
+                    continue
+        self._holiday_dates: frozenset[dt.date] = frozenset(holiday_dates)
    
     def is_weekend(self, value: int | dt.date | dt.datetime) -> bool:
         """
@@ -81,7 +120,9 @@ class BizPolicy:
             weekday = value.weekday()
         else:
             raise TypeError("is_workday expects int, date, or datetime")
-        return weekday in self.workdays
+        # Out-of-range ints (including negatives) are simply not workdays,
+        # matching the old list-membership behavior.
+        return 0 <= weekday <= 6 and bool((self._workday_mask >> weekday) & 1)
 
     def is_business_day(self, value: dt.date | dt.datetime) -> bool:
         """
@@ -93,8 +134,8 @@ class BizPolicy:
             weekday = value.weekday()
         else:
             raise TypeError("is_business_day expects date, or datetime")
-        
-        return weekday in self.workdays and not self.is_holiday(value)
+
+        return bool((self._workday_mask >> weekday) & 1) and not self.is_holiday(value)
 
     def is_business_time(self, time: dt.time) -> bool:
         """
@@ -128,24 +169,27 @@ class BizPolicy:
             - datetime.datetime
         """
         if isinstance(value, str) and self.valid_date_str(value):
-            # Strict YYYY-MM-DD: year 1900-2099, month 01-12, day 01-31
-            date_str = value
+            # Strict YYYY-MM-DD: year 1900-2099, month 01-12, day 01-31.
+            # Membership is against the normalized date set, so string and
+            # date/datetime queries agree regardless of how the holidays
+            # were supplied.
+            return dt.date.fromisoformat(value) in self._holiday_dates
         elif isinstance(value, str):
             # String, but not a valid date string
             raise ValueError(
                 f"is_holiday expects str (YYYY-MM-DD) in range 1900-2099, got '{value}'"
             )
         elif isinstance(value, dt.datetime):
-            date_str = value.strftime("%Y-%m-%d")
+            # Hash lookup on the precomputed date set; no string formatting.
+            return value.date() in self._holiday_dates
         elif isinstance(value, dt.date): # type:ignore # Run time type checker
-            date_str = value.strftime("%Y-%m-%d")
+            return value in self._holiday_dates
         else:
             raise TypeError(
                 "is_holiday expects str (YYYY-MM-DD), datetime.date, or "
                 "datetime.datetime, got "
                 f"{type(value).__name__}"
             )
-        return date_str in self.holidays
     
     def business_day_fraction(self, dt_obj: dt.datetime) -> float:
         """
@@ -163,9 +207,8 @@ class BizPolicy:
         """
         
         weekday = dt_obj.weekday()
-        date_str = dt_obj.strftime("%Y-%m-%d")
-        
-        if self.is_holiday(date_str) or not self.is_workday(weekday):
+
+        if dt_obj.date() in self._holiday_dates or not self.is_workday(weekday):
             return 0.0
         
         start:dt.time = self.start_of_business
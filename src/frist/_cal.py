@@ -28,6 +28,9 @@ if TYPE_CHECKING:  # pragma: no cover
 class Cal:
     """Calendar window filtering functionality for direct datetime/timestamp inputs."""
 
+    # "__dict__" stays in slots so the cached_property units have storage.
+    __slots__ = ("_target_dt", "_ref_dt", "__dict__")
+
     def __init__(
         self,
         target_dt: TimeLike,
@@ -51,7 +54,22 @@ class Cal:
     def ref_dt(self) -> dt.datetime:
         """Get the reference datetime."""
         return self._ref_dt
-    
+
+    @classmethod
+    def batch(
+        cls,
+        targets: list[TimeLike],
+        ref_dt: TimeLike,
+        formats: list[str] | None = None,
+    ) -> list["Cal"]:
+        """Build one Cal per target against a shared reference datetime.
+
+        Normalizes ``ref_dt`` once rather than re-parsing it for every target,
+        which matters when the targets are strings or timestamps.
+        """
+        _, ref = time_pair(start_time=ref_dt, end_time=ref_dt, formats__=formats)
+        return [cls(target, ref, formats=formats) for target in targets]
+
 
 
 
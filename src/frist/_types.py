@@ -3,15 +3,87 @@ Shared types and conversion utilities for frist package.
 """
 
 import datetime as dt
+import re
+from functools import lru_cache
 from typing import TypeAlias
 
 from ._constants import CHRONO_DATETIME_FORMATS
 
+# Precompiled fast path covering the default CHRONO_DATETIME_FORMATS:
+# "YYYY-MM-DD", "YYYY-MM-DD HH:MM:SS", "YYYY-MM-DDTHH:MM:SS[Z]".
+_ISO_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})(?:([ T])(\d{2}):(\d{2}):(\d{2})(Z?))?$"
+)
+_DEFAULT_FORMATS = tuple(CHRONO_DATETIME_FORMATS)
+
 # Alias for inputs accepted by Frist time utilities (datetime, date, POSIX ts, or str)
 # Note: explicit optionality (`| None`) should be expressed at the call site.
 TimeLike: TypeAlias = dt.datetime | dt.date | float | int | str
 
 
+@lru_cache(maxsize=4096)
+def _parse_time_string(val: str, formats: tuple[str, ...]) -> dt.datetime:
+    """
+    Parse a datetime string against the allowed formats, caching results.
+
+    Repeated identical strings (common in batch workloads and tests) hit the
+    cache instead of re-running strptime. Failures raise and are not cached,
+    so unrecognized strings always surface the same TypeError.
+
+    For the default format list, a precompiled regex plus direct datetime
+    construction avoids strptime's format-interpretation overhead; anything
+    the regex rejects (or non-default formats) takes the strptime loop.
+    """
+    if formats == _DEFAULT_FORMATS:
+        m = _ISO_RE.match(val)
+        # The "Z" suffix is only part of the "T"-separated ISO format.
+        if m and (not m[8] or m[4] == "T"):
+            try:
+                return dt.datetime(
+                    int(m[1]), int(m[2]), int(m[3]),
+                    int(m[5] or 0), int(m[6] or 0), int(m[7] or 0),
+                )
+            except ValueError:
+                pass  # e.g. month 13; fall through so the error text matches
+    for format in formats:
+        try:
+            return dt.datetime.strptime(val, format)
+        except ValueError:
+            continue
+    raise TypeError(f"Unrecognized datetime string format: {val}")
+
+
+def _datetime_identity(val: dt.datetime, formats: list[str] | None) -> dt.datetime:
+    return val
+
+
+def _datetime_from_date(val: dt.date, formats: list[str] | None) -> dt.datetime:
+    # Direct constructor: skips combine()'s classmethod dispatch and the
+    # throwaway time(0, 0, 0) allocation for the midnight case.
+    return dt.datetime(val.year, val.month, val.day)
+
+
+def _datetime_from_timestamp(val: float, formats: list[str] | None) -> dt.datetime:
+    return dt.datetime.fromtimestamp(val)
+
+
+def _datetime_from_string(val: str, formats: list[str] | None) -> dt.datetime:
+    return _parse_time_string(val, tuple(formats or CHRONO_DATETIME_FORMATS))
+
+
+# Exact-type dispatch for to_datetime: a single dict lookup replaces the
+# isinstance chain for the concrete types callers actually pass. Subclasses
+# (and bool, deliberately absent here) fall back to the isinstance chain,
+# which preserves the datetime-before-date ordering and the TypeError.
+_DISPATCH: dict[type, object] = {
+    dt.datetime: _datetime_identity,
+    dt.date: _datetime_from_date,
+    float: _datetime_from_timestamp,
+    int: _datetime_from_timestamp,
+    str: _datetime_from_string,
+}
+
+
 def to_datetime(val: TimeLike, formats: list[str] | None = None) -> dt.datetime:
     """
     Convert a TimeLike value to a datetime object.
@@ -27,21 +99,20 @@ def to_datetime(val: TimeLike, formats: list[str] | None = None) -> dt.datetime:
     Raises:
         TypeError: If value is not a supported type or unrecognized string format
     """
-    # In order of expected frequency of use
+    handler = _DISPATCH.get(type(val))
+    if handler is not None:
+        return handler(val, formats)  # type: ignore[operator]
+
+    # Subclass fallback, in order of expected frequency of use.
     if isinstance(val, dt.datetime):
         return val
     elif isinstance(val, dt.date):
-        return dt.datetime.combine(val, dt.time(0, 0, 0))
+        return dt.datetime(val.year, val.month, val.day)
     elif isinstance(val, (float, int)):
         return dt.datetime.fromtimestamp(val)
     elif isinstance(val, str):  # type: ignore # Run time type checker
         format_list = formats or CHRONO_DATETIME_FORMATS
-        for format in format_list:
-            try:
-                return dt.datetime.strptime(val, format)
-            except ValueError:
-                continue
-        raise TypeError(f"Unrecognized datetime string format: {val}")
+        return _parse_time_string(val, tuple(format_list))
     else:
         raise TypeError("Value must be datetime, date, float, int, or str")
 
@@ -100,4 +171,46 @@ def time_pair(
     if tz1 is not None and tz1 != tz2:
         raise ValueError("Datetime timezone mismatch: differing tzinfo")
 
-    return normalized_start_time, normalized_end_time
\ No newline at end of file
+    return normalized_start_time, normalized_end_time
+
+
+def time_pair_many(
+    starts: list[TimeLike],
+    ends: list[TimeLike | None] | None = None,
+    formats__: list[str] | None = None,
+) -> list[tuple[dt.datetime, dt.datetime]]:
+    """
+    Normalize many (start, end) time pairs in one call.
+
+    Batch counterpart to `time_pair` for high-volume callers: when `ends`
+    is None (or contains None entries), `datetime.now()` is evaluated at
+    most once and shared across the batch, instead of once per pair. This
+    also guarantees every defaulted pair sees the same reference instant.
+
+    Args:
+        starts: Start values, one per pair (same types as time_pair).
+        ends: Optional end values; None (or a None entry) defaults to now.
+        formats__ (list[str], optional): List of datetime formats for string parsing.
+
+    Returns:
+        list[tuple[datetime, datetime]]: One normalized pair per start.
+
+    Raises:
+        TypeError: As time_pair, for any invalid pair.
+        ValueError: If `ends` is provided with a different length than `starts`.
+    """
+    if ends is None:
+        ends = [None] * len(starts)
+    elif len(ends) != len(starts):
+        raise ValueError(
+            f"starts and ends must be the same length, got {len(starts)} and {len(ends)}"
+        )
+    now: dt.datetime | None = None
+    pairs: list[tuple[dt.datetime, dt.datetime]] = []
+    for start, end in zip(starts, ends):
+        if end is None:
+            if now is None:
+                now = dt.datetime.now()
+            end = now
+        pairs.append(time_pair(start_time=start, end_time=end, formats__=formats__))
+    return pairs
\ No newline at end of file
@@ -10,21 +10,34 @@ All functions follow PEP 8 and Google-style docstrings.
 """
 
 import datetime as dt
-from typing import Any
+from typing import Any, Protocol, TypeVar
 
 from ._constants import WEEKDAY_INDEX
 
 
-def normalize_weekday(day_spec: str) -> int:
+class _Comparable(Protocol):
+    """Anything supporting ordered comparison (ints, dates, datetimes, ...)."""
+
+    def __le__(self, other: Any, /) -> bool: ...
+
+    def __lt__(self, other: Any, /) -> bool: ...
+
+
+_T = TypeVar("_T", bound=_Comparable)
+
+
+def normalize_weekday(day_spec: str | int) -> int:
     """Normalize various day-of-week specifications to Python weekday numbers.
 
     Args:
-        day_spec: Day specification as a string
+        day_spec: Day specification as a string, or an int already in Python
+            weekday form (0=Monday .. 6=Sunday)
 
     Returns:
         int: Python weekday number (0=Monday, 1=Tuesday, ..., 6=Sunday)
 
     Accepts:
+        - Python weekday ints: 0 (Monday) through 6 (Sunday)
         - Full names: 'monday', 'tuesday', 'wednesday', 'thursday', 'friday',
           'saturday', 'sunday'
         - 3-letter abbrev: 'mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun'
@@ -37,7 +50,18 @@ def normalize_weekday(day_spec: str) -> int:
         normalize_weekday('MON') -> 0
         normalize_weekday('w-sun') -> 6
         normalize_weekday('thu') -> 3
+        normalize_weekday(4) -> 4
     """
+    # Int fast path: already a weekday number, so skip string normalization.
+    # bool is excluded: True/False as a weekday is almost certainly a bug.
+    if isinstance(day_spec, int) and not isinstance(day_spec, bool):
+        if 0 <= day_spec <= 6:
+            return day_spec
+        raise ValueError(
+            f"Invalid day specification: {day_spec}. "
+            "Integer weekdays must be 0 (Monday) through 6 (Sunday)."
+        )
+
     day_spec = str(day_spec).lower().strip()
 
     # Remove pandas-style prefix
@@ -63,33 +87,45 @@ def normalize_weekday(day_spec: str) -> int:
 # verify_start_end decorator removed; unit adapters own validation/normalization.
 
 
-def in_half_open(start: int, value: int, end: int) -> bool:
+def count_workdays(workday_mask: int, first: dt.date, last: dt.date) -> int:
     """
-    Return True when value is in the half-open interval [start, end).
-
-    The use of ANY here might be painful to look at but in the codebase open ended
-    intervals are used for integers, tuples, and datetimes.
-    """
-    return start <= value < end
+    Count days in the inclusive range [first, last] whose weekday bit is set.
 
+    `workday_mask` is the 7-bit mask built by `BizPolicy` (bit n set means
+    weekday n is a workday). Uses closed-form full-week arithmetic plus at
+    most six per-day checks instead of iterating the whole range, so long
+    spans cost the same as short ones.
 
-def in_half_open_dt(start: dt.datetime, value: dt.datetime, end: dt.datetime) -> bool:
+    Returns 0 when the range is empty (first > last).
+    """
+    # Pure ordinal arithmetic: (ordinal + 6) % 7 == weekday(), so neither a
+    # timedelta nor a weekday() call is needed to size and anchor the range.
+    first_ord = first.toordinal()
+    n = last.toordinal() - first_ord + 1
+    if n <= 0:
+        return 0
+    full_weeks, rem = divmod(n, 7)
+    count = full_weeks * (workday_mask & 0x7F).bit_count()
+    start_weekday = (first_ord + 6) % 7
+    for i in range(rem):
+        count += (workday_mask >> ((start_weekday + i) % 7)) & 1
+    return count
+
+
+def in_half_open(start: _T, value: _T, end: _T) -> bool:
     """
     Return True when value is in the half-open interval [start, end).
 
-    Note: this seems like possible overkill, but I made the mistake of making the end
-          comparison <= instead of < in a few cases, so this utility function should
-          help avoid that mistake and it makes half_open semantics explicit.
+    The comparison is type-agnostic: the codebase uses it for integers,
+    tuples, dates, and datetimes alike. The helper exists to make half-open
+    semantics explicit — the end comparison being < rather than <= has been
+    gotten wrong inline before.
     """
     return start <= value < end
 
 
-def in_half_open_date(start: dt.date, value: dt.date, end: dt.date) -> bool:
-    """
-    Return True when value is in the half-open interval [start, end).
-
-    Note: this seems like possible overkill, but I made the mistake of making the end
-          comparison <= instead of < in a few cases, so this utility function should
-          help avoid that mistake and it makes half_open semantics explicit.
-    """
-    return start <= value < end
+# Typed aliases kept for readability at date/datetime call sites; chained
+# comparison works identically for every ordered type, so one implementation
+# serves all three names.
+in_half_open_dt = in_half_open
+in_half_open_date = in_half_open
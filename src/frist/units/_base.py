@@ -47,6 +47,10 @@ TCal = TypeVar("TCal", bound=CalProtocol)
 # Constrained literal type for boundary inclusivity in `between()`
 Inclusive = Literal["both", "left", "right", "neither"]
 
+# Shared offset tables for `between()`; built once at import instead of per call.
+_START_OFFSETS: Mapping[Inclusive, int] = {"both": 0, "left": 0, "right": 1, "neither": 1}
+_END_OFFSETS: Mapping[Inclusive, int] = {"both": 1, "left": 0, "right": 1, "neither": 0}
+
 
 class UnitName(Generic[TCal], ABC):
     """Base unit name for time unit operations with half-open semantics.
@@ -55,8 +59,14 @@ class UnitName(Generic[TCal], ABC):
     parent object's `target_dt` and `ref_dt` (as required by `CalProtocol`).
     Concrete units implement `_in_impl(start, end)` using those two
     datetimes; no other parent state is required.
+
+    The whole hierarchy is slotted: units are small, short-lived objects
+    built per `Cal`/`Biz`, so fixed slot storage beats a per-instance dict.
+    Subclasses declare `__slots__` for exactly the attributes they add.
     """
 
+    __slots__ = ("_cal",)
+
     def __init__(self, cal: TCal) -> None:
         self._cal = cal
 
@@ -98,18 +108,15 @@ class UnitName(Generic[TCal], ABC):
                 - When `end is None`, it returns a single-unit window shifted by inclusivity:
                     `adj_start = start + start_offsets[inclusive]` and `adj_end = adj_start + 1`.
         """
+        if inclusive not in _START_OFFSETS:
+            raise ValueError(f"Invalid inclusive value: {inclusive!r}")
+
         if end is None:
-            adj_start = start + {"both": 0, "left": 0, "right": 1, "neither": 1}[inclusive]
+            adj_start = start + _START_OFFSETS[inclusive]
             return self.in_(adj_start, adj_start + 1)
 
-        start_offsets: Mapping[Inclusive, int] = {"both": 0, "left": 0, "right": 1, "neither": 1}
-        end_offsets: Mapping[Inclusive, int] = {"both": 1, "left": 0, "right": 1, "neither": 0}
-
-        if inclusive not in start_offsets:
-            raise ValueError(f"Invalid inclusive value: {inclusive!r}")
-
-        adj_start = start + start_offsets[inclusive]
-        adj_end = end + end_offsets[inclusive]
+        adj_start = start + _START_OFFSETS[inclusive]
+        adj_end = end + _END_OFFSETS[inclusive]
         return self.in_(adj_start, adj_end)
 
     def thru(self, start: int = 0, end: int | None = None) -> bool:
@@ -9,10 +9,22 @@ from __future__ import annotations
 import datetime as dt
 
 from .._biz_policy import BizPolicy
-from .._util import in_half_open_date
+from .._util import count_workdays, in_half_open_date
 from ._base import CalProtocol
 from ._day import DayUnit
 
+# Messages for the unsupported shortcuts below, built once at import. The
+# exception itself is constructed per raise: a shared instance would keep
+# accumulating traceback frames across raises.
+_YESTERDAY_MSG = (
+    "Unsupported on business days: weekends/holidays break contiguity. "
+    "Use explicit window checks via in_(start, end), e.g., in_(-1, 0)."
+)
+_TOMORROW_MSG = (
+    "Unsupported on business days: weekends/holidays break contiguity. "
+    "Use explicit window checks via in_(start, end), e.g., in_(1, 2)."
+)
+
 
 class BizDayUnit(DayUnit):
     """Business day unit (inherits Day metadata).
@@ -22,6 +34,8 @@ class BizDayUnit(DayUnit):
     - Shortcut: `is_today` only. Use explicit windows with `in_` for previous/next business days.
     """
 
+    __slots__ = ("_policy",)
+
     def __init__(self, cal: CalProtocol, policy: BizPolicy) -> None:
         super().__init__(cal)
         self._policy = policy
@@ -65,8 +79,8 @@ class BizDayUnit(DayUnit):
         return current
 
     def _in_impl(self, start: int, end: int) -> bool:
-        ref = self._cal.ref_dt.date()
-        tgt = self._cal.target_dt.date()
+        ref = self._ref_date
+        tgt = self._target_date
         if not self._policy.is_business_day(tgt):
             return False
         start_date = self.move_n_days(ref, start)
@@ -88,10 +102,7 @@ class BizDayUnit(DayUnit):
 
         Use explicit window checks via `in_(start, end)`, e.g., `in_(-1, 0)`.
         """
-        raise ValueError(
-            "Unsupported on business days: weekends/holidays break contiguity. "
-            "Use explicit window checks via in_(start, end), e.g., in_(-1, 0)."
-        )
+        raise ValueError(_YESTERDAY_MSG)
 
     @property
     def is_tomorrow(self) -> bool:
@@ -99,10 +110,7 @@ class BizDayUnit(DayUnit):
 
         Use explicit window checks via `in_(start, end)`, e.g., `in_(1, 2)`.
         """
-        raise ValueError(
-            "Unsupported on business days: weekends/holidays break contiguity. "
-            "Use explicit window checks via in_(start, end), e.g., in_(1, 2)."
-        )
+        raise ValueError(_TOMORROW_MSG)
 
 
     def business_days(self) -> float:
@@ -110,6 +118,11 @@ class BizDayUnit(DayUnit):
 
         Positive when `target_dt <= ref_dt`, negative when `target_dt > ref_dt`.
         Uses policy.business_day_fraction (holidays contribute 0.0).
+
+        Only the two endpoint days need fractional treatment; the interior
+        full days are counted in closed form (`count_workdays` minus any
+        holidays landing on interior workdays), so long spans do not require
+        a day-by-day walk.
         """
         policy = self._policy
         start = self._cal.target_dt
@@ -118,30 +131,37 @@ class BizDayUnit(DayUnit):
         if start == end:
             return 0.0
 
+        # Endpoint dates come from the values cached at construction; the
+        # swap below keeps them aligned with the (possibly exchanged) bounds.
         sign = 1.0
+        start_date = self._target_date
+        end_date = self._ref_date
         if start > end:
             start, end = end, start
+            start_date, end_date = end_date, start_date
             sign = -1.0
 
+        frac_at = policy.business_day_fraction
+
+        if start_date == end_date:
+            if not policy.is_business_day(start):
+                return 0.0
+            return sign * max(frac_at(end) - frac_at(start), 0.0)
+
         total = 0.0
-        current = start
-
-        def frac_at(dt_obj: dt.datetime) -> float:
-            return policy.business_day_fraction(dt_obj)
-
-        while current.date() <= end.date():
-            if policy.is_business_day(current):
-                if current.date() == start.date():
-                    start_dt = start
-                    end_dt = min(end, dt.datetime.combine(current.date(), policy.end_of_business))
-                elif current.date() == end.date():
-                    start_dt = dt.datetime.combine(current.date(), policy.start_of_business)
-                    end_dt = end
-                else:
-                    start_dt = dt.datetime.combine(current.date(), policy.start_of_business)
-                    end_dt = dt.datetime.combine(current.date(), policy.end_of_business)
-                total += max(frac_at(end_dt) - frac_at(start_dt), 0.0)
-            current = current + dt.timedelta(days=1)
+        # First day: remainder of the business day after `start`.
+        if policy.is_business_day(start):
+            total += 1.0 - frac_at(start)
+        # Last day: portion of the business day elapsed at `end`.
+        if policy.is_business_day(end):
+            total += frac_at(end)
+        # Interior full days: workday count minus holidays on workdays.
+        interior_first = start_date + dt.timedelta(days=1)
+        interior_last = end_date - dt.timedelta(days=1)
+        total += count_workdays(policy._workday_mask, interior_first, interior_last)
+        for holiday in policy._holiday_dates:
+            if interior_first <= holiday <= interior_last and policy.is_workday(holiday):
+                total -= 1
 
         return sign * total
 
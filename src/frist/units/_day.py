@@ -9,25 +9,34 @@ from __future__ import annotations
 import datetime as dt
 
 from ._base import UnitName, CalProtocol
-from .._util import in_half_open_date
+from .._util import in_half_open
 
 
 class DayUnit(UnitName[CalProtocol]):
     """Day-specific unit that implements _in_impl with day logic."""
 
+    __slots__ = ("_target_date", "_ref_date", "_target_ord", "_ref_ord", "_day_delta")
+
     def __init__(self, cal: CalProtocol) -> None:
         super().__init__(cal)
+        # The parent's datetimes never change, so the date components are
+        # extracted once instead of on every window check. The business/work
+        # day subclasses still need the dates; the ordinals make the plain
+        # day window check pure integer arithmetic, and the signed day delta
+        # collapses every window check (and the today/yesterday/tomorrow
+        # shortcuts) to one comparison against the raw offsets.
+        self._target_date: dt.date = cal.target_dt.date()
+        self._ref_date: dt.date = cal.ref_dt.date()
+        self._target_ord: int = self._target_date.toordinal()
+        self._ref_ord: int = self._ref_date.toordinal()
+        self._day_delta: int = self._target_ord - self._ref_ord
 
     def _in_impl(self, start: int, end: int) -> bool:
         """Day-specific logic (moved from cal.in_days)."""
 
-        target_date = self._cal.target_dt.date()
-
-        # Calculate the date range boundaries
-        start_date: dt.datetime = (self._cal.ref_dt + dt.timedelta(days=start)).date()
-        end_date: dt.datetime = (self._cal.ref_dt + dt.timedelta(days=end)).date()
-
-        return in_half_open_date(start_date, target_date, end_date)
+        # start <= delta < end is ref_ord+start <= target_ord < ref_ord+end
+        # with the reference subtracted out once at construction.
+        return in_half_open(start, self._day_delta, end)
 
     @property
     def val(self) -> int:
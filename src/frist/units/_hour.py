@@ -8,28 +8,34 @@ from __future__ import annotations
 
 import datetime as dt
 
-from .._util import in_half_open_dt
+from .._util import in_half_open
 from ._base import CalProtocol, UnitName
 
 
+def _hour_index(d: dt.datetime) -> int:
+    """Monotonic whole-hour index (hours since day 1, minutes dropped)."""
+    return d.toordinal() * 24 + d.hour
+
+
 class HourUnit(UnitName[CalProtocol]):
     """Hour-specific unit implementing hour-aligned half-open logic."""
 
+    __slots__ = ("_ref_hour_idx", "_target_hour_idx")
+
     def __init__(self, cal: CalProtocol) -> None:
         super().__init__(cal)
+        # Hour indexes computed once; whole-hour offsets from the truncated
+        # reference reduce to integer offsets on the index, so each window
+        # check is pure integer arithmetic.
+        self._ref_hour_idx: int = _hour_index(cal.ref_dt)
+        self._target_hour_idx: int = _hour_index(cal.target_dt)
 
     def _in_impl(self, start: int, end: int) -> bool:
-
-        ref: dt.datetime = self._cal.ref_dt
-        target: dt.datetime = self._cal.target_dt
-
-        start_time: dt.datetime = ref + dt.timedelta(hours=start)
-        start_hour: dt.datetime = start_time.replace(minute=0, second=0, microsecond=0)
-
-        end_time: dt.datetime = ref + dt.timedelta(hours=end)
-        end_hour: dt.datetime = end_time.replace(minute=0, second=0, microsecond=0)
-
-        return in_half_open_dt(start_hour, target, end_hour)
+        return in_half_open(
+            self._ref_hour_idx + start,
+            self._target_hour_idx,
+            self._ref_hour_idx + end,
+        )
 
     @property
     def val(self) -> int:
@@ -8,28 +8,34 @@ from __future__ import annotations
 
 import datetime as dt
 
-from .._util import in_half_open_dt
+from .._util import in_half_open
 from ._base import CalProtocol, UnitName
 
 
+def _minute_index(d: dt.datetime) -> int:
+    """Monotonic whole-minute index (minutes since day 1, seconds dropped)."""
+    return (d.toordinal() * 24 + d.hour) * 60 + d.minute
+
+
 class MinuteUnit(UnitName[CalProtocol]):
     """Minute-specific unit implementing minute-aligned half-open logic."""
 
+    __slots__ = ("_ref_minute_idx", "_target_minute_idx")
+
     def __init__(self, cal: CalProtocol) -> None:
         super().__init__(cal)
+        # Minute indexes computed once; adding whole minutes and truncating
+        # is equivalent to integer offsets on the truncated index, so each
+        # window check is pure integer arithmetic.
+        self._ref_minute_idx: int = _minute_index(cal.ref_dt)
+        self._target_minute_idx: int = _minute_index(cal.target_dt)
 
     def _in_impl(self, start: int, end: int) -> bool:
-
-        ref: dt.datetime = self._cal.ref_dt
-        target: dt.datetime = self._cal.target_dt
-
-        start_time: dt.datetime = ref + dt.timedelta(minutes=start)
-        start_minute: dt.datetime = start_time.replace(second=0, microsecond=0)
-
-        end_time: dt.datetime = ref + dt.timedelta(minutes=end)
-        end_minute: dt.datetime = end_time.replace(second=0, microsecond=0)
-
-        return in_half_open_dt(start_minute, target, end_minute)
+        return in_half_open(
+            self._ref_minute_idx + start,
+            self._target_minute_idx,
+            self._ref_minute_idx + end,
+        )
 
     @property
     def val(self) -> int:
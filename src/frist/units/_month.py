@@ -18,8 +18,13 @@ from .._util import in_half_open, normalize_weekday
 class MonthUnit(UnitName[CalProtocol]):
     """Month-specific unit that implements _in_impl with month logic."""
 
+    __slots__ = ("_ref_month_idx", "_target_month_idx")
+
     def __init__(self, cal: CalProtocol) -> None:
         super().__init__(cal)
+        # Month indexes computed once; window checks are integer comparisons.
+        self._ref_month_idx: int = self._month_index(cal.ref_dt)
+        self._target_month_idx: int = self._month_index(cal.target_dt)
 
     def _month_index(self, d: dt.datetime) -> int:
         """Get a monotonic month index for comparison."""
@@ -27,14 +32,18 @@ class MonthUnit(UnitName[CalProtocol]):
 
     def _in_impl(self, start: int, end: int) -> bool:
         """Month-specific logic (moved from cal.in_months)."""
-        target_idx: int = self._month_index(self._cal.target_dt)
-        start_idx = self._month_index(self._cal.ref_dt) + start
-        end_idx = self._month_index(self._cal.ref_dt) + end
-        return in_half_open(start_idx, target_idx, end_idx)
+        return in_half_open(
+            self._ref_month_idx + start,
+            self._target_month_idx,
+            self._ref_month_idx + end,
+        )
 
-    def nth_weekday(self, weekday: str, n: int) -> dt.datetime:
+    def nth_weekday(self, weekday: str | int, n: int) -> dt.datetime:
         """
         Get the datetime of the nth occurrence of weekday in ref_dt's month.
+
+        `weekday` accepts any spec `normalize_weekday` does, including a
+        Python weekday int (0=Monday .. 6=Sunday).
         """
         ref_date: dt.date = self._cal.ref_dt.date()
         weekday_num = normalize_weekday(weekday)
@@ -60,7 +69,7 @@ class MonthUnit(UnitName[CalProtocol]):
         occurrence = occurrences[0]
         return occurrence.replace(hour=0, minute=0, second=0, microsecond=0)
 
-    def is_nth_weekday(self, weekday: str, n: int) -> bool:
+    def is_nth_weekday(self, weekday: str | int, n: int) -> bool:
         try:
             nth_datetime = self.nth_weekday(weekday, n)
             return self._cal.target_dt.date() == nth_datetime.date()
@@ -15,28 +15,21 @@ from .._util import in_half_open
 class QuarterUnit(UnitName[CalProtocol]):
     """Quarter-specific unit implementing quarter-index half-open logic."""
 
+    __slots__ = ("_ref_qtr_idx", "_target_qtr_idx")
+
     def __init__(self, cal: CalProtocol) -> None:
         super().__init__(cal)
+        # Monotonic quarter indexes (year*4 + quarter) computed once; every
+        # window check is then integer comparison against the cached values.
+        ref = cal.ref_dt
+        target = cal.target_dt
+        self._ref_qtr_idx: int = ref.year * 4 + (ref.month - 1) // 3
+        self._target_qtr_idx: int = target.year * 4 + (target.month - 1) // 3
 
     def _in_impl(self, start: int, end: int) -> bool:
-
-        target_time = self._cal.target_dt
-        base_time = self._cal.ref_dt
-
-        base_quarter = (base_time.month - 1) // 3  # 0..3
-        base_year = base_time.year
-
-        def quarter_index_for_offset(offset: int) -> int:
-            return base_year * 4 + base_quarter + offset
-
-        start_idx = quarter_index_for_offset(start)
-        end_idx = quarter_index_for_offset(end)
-
-        target_quarter = (target_time.month - 1) // 3
-        target_year = target_time.year
-        target_idx = target_year * 4 + target_quarter
-
-        return in_half_open(start_idx, target_idx, end_idx)
+        return in_half_open(
+            self._ref_qtr_idx + start, self._target_qtr_idx, self._ref_qtr_idx + end
+        )
 
     @property
     def val(self) -> int:
@@ -15,6 +15,8 @@ from ._base import CalProtocol, UnitName
 class SecondUnit(UnitName[CalProtocol]):
     """Second-specific unit implementing second-aligned half-open logic."""
 
+    __slots__ = ()
+
     def __init__(self, cal: CalProtocol) -> None:
         super().__init__(cal)
 
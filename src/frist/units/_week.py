@@ -8,37 +8,37 @@ from __future__ import annotations
 
 import datetime as dt
 
-from .._util import in_half_open_date, normalize_weekday
+from .._util import in_half_open, normalize_weekday
 from ._base import CalProtocol, UnitName
 
 
 class WeekUnit(UnitName[CalProtocol]):
     """Week-specific unit that implements _in_impl with week logic."""
 
+    __slots__ = ("_target_ord", "_week_start_ord")
+
     def __init__(self, cal: CalProtocol) -> None:
         super().__init__(cal)
+        # Week windows are all offsets from the same week start, so resolve it
+        # once here instead of on every window check. Boundaries are kept as
+        # proleptic-Gregorian ordinals so window checks are plain integer
+        # arithmetic rather than timedelta allocation and date addition.
+        week_start_day: int = normalize_weekday("monday")  # default week start
+        base_date: dt.date = cal.ref_dt.date()
+        days_since_week_start: int = (base_date.weekday() - week_start_day) % 7
+        self._target_ord: int = cal.target_dt.date().toordinal()
+        self._week_start_ord: int = base_date.toordinal() - days_since_week_start
 
     def _in_impl(self, start: int, end: int) -> bool:
         """Week-specific logic (moved from cal.in_weeks)."""
 
-        week_start_day: int = normalize_weekday("monday")  # default week start
-
-        target_date: dt.date = self._cal.target_dt.date()
-        base_date: dt.date = self._cal.ref_dt.date()
-
-        # Calculate the start of the current week based on week_start_day
-        days_since_week_start: int = (base_date.weekday() - week_start_day) % 7
-        current_week_start: dt.date = base_date - dt.timedelta(days=days_since_week_start)
-
-        # Calculate week boundaries
-        start_week_start = current_week_start + dt.timedelta(weeks=start)
-        end_week_start = current_week_start + dt.timedelta(weeks=end)
-        # Half-open semantics for weeks: `end_week_start` is already the
-        # exclusive start-of-week produced by the normalized `end` value;
-        # do not add an extra week here.
-        end_week_exclusive = end_week_start
+        # Week boundaries as ordinals; `end` is already the exclusive
+        # start-of-week produced by the normalized value, so no extra week
+        # is added here (half-open semantics).
+        start_ord = self._week_start_ord + 7 * start
+        end_ord = self._week_start_ord + 7 * end
 
-        return in_half_open_date(start_week_start, target_date, end_week_exclusive)
+        return in_half_open(start_ord, self._target_ord, end_ord)
 
     @property
     def val(self) -> int:
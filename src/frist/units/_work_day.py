@@ -9,10 +9,22 @@ from __future__ import annotations
 import datetime as dt
 
 from .._biz_policy import BizPolicy
-from .._util import in_half_open_date
+from .._util import count_workdays, in_half_open_date
 from ._base import CalProtocol
 from ._day import DayUnit
 
+# Messages for the unsupported shortcuts below, built once at import. The
+# exception itself is constructed per raise: a shared instance would keep
+# accumulating traceback frames across raises.
+_YESTERDAY_MSG = (
+    "Unsupported on working days: weekends/holidays break contiguity. "
+    "Use explicit window checks via in_(start, end), e.g., in_(-1, 0)."
+)
+_TOMORROW_MSG = (
+    "Unsupported on working days: weekends/holidays break contiguity. "
+    "Use explicit window checks via in_(start, end), e.g., in_(1, 2)."
+)
+
 
 class WorkingDayUnit(DayUnit):
     """Working day unit (inherits Day metadata).
@@ -22,6 +34,8 @@ class WorkingDayUnit(DayUnit):
     - Shortcut: `is_today` only. Use explicit windows with `in_` for previous/next working days.
     """
 
+    __slots__ = ("_policy",)
+
     def __init__(self, cal: CalProtocol, policy: BizPolicy) -> None:
         super().__init__(cal)
         self._policy = policy
@@ -65,8 +79,8 @@ class WorkingDayUnit(DayUnit):
         return current
 
     def _in_impl(self, start: int, end: int) -> bool:
-        ref = self._cal.ref_dt.date()
-        tgt = self._cal.target_dt.date()
+        ref = self._ref_date
+        tgt = self._target_date
         if not self._policy.is_workday(tgt):
             return False
         start_date = self.move_n_days(ref, start)
@@ -92,6 +106,10 @@ class WorkingDayUnit(DayUnit):
 
         Positive when `target_dt <= ref_dt`, negative when `target_dt > ref_dt`.
         Holidays are ignored (only workdays contribute).
+
+        Only the two endpoint days need fractional treatment; the interior
+        full days are counted in closed form via `count_workdays`, so long
+        spans do not require a day-by-day walk.
         """
         policy = self._policy
         start = self._cal.target_dt
@@ -100,31 +118,37 @@ class WorkingDayUnit(DayUnit):
         if start == end:
             return 0.0
 
+        # Endpoint dates come from the values cached at construction; the
+        # swap below keeps them aligned with the (possibly exchanged) bounds.
         sign = 1.0
+        start_date = self._target_date
+        end_date = self._ref_date
         if start > end:
             start, end = end, start
+            start_date, end_date = end_date, start_date
             sign = -1.0
 
+        if start_date == end_date:
+            if not policy.is_workday(start):
+                return 0.0
+            total = max(
+                self.workday_fraction_at(end) - self.workday_fraction_at(start), 0.0
+            )
+            return sign * total
+
         total = 0.0
-        current = start
-
-        while current.date() <= end.date():
-            if policy.is_workday(current):
-                if current.date() == start.date():
-                    start_dt = start
-                    end_dt = min(end, dt.datetime.combine(current.date(), policy.end_of_business))
-                elif current.date() == end.date():
-                    start_dt = dt.datetime.combine(current.date(), policy.start_of_business)
-                    end_dt = end
-                else:
-                    start_dt = dt.datetime.combine(current.date(), policy.start_of_business)
-                    end_dt = dt.datetime.combine(current.date(), policy.end_of_business)
-
-                total += max(
-                    self.workday_fraction_at(end_dt) - self.workday_fraction_at(start_dt),
-                    0.0,
-                )
-            current = current + dt.timedelta(days=1)
+        # First day: remainder of the working day after `start`.
+        if policy.is_workday(start):
+            total += 1.0 - self.workday_fraction_at(start)
+        # Last day: portion of the working day elapsed at `end`.
+        if policy.is_workday(end):
+            total += self.workday_fraction_at(end)
+        # Interior full days, counted arithmetically.
+        total += count_workdays(
+            policy._workday_mask,
+            start_date + dt.timedelta(days=1),
+            end_date - dt.timedelta(days=1),
+        )
 
         return sign * total
 
@@ -145,10 +169,7 @@ class WorkingDayUnit(DayUnit):
 
         Use explicit window checks via `in_(start, end)`, e.g., `in_(-1, 0)`.
         """
-        raise ValueError(
-            "Unsupported on working days: weekends/holidays break contiguity. "
-            "Use explicit window checks via in_(start, end), e.g., in_(-1, 0)."
-        )
+        raise ValueError(_YESTERDAY_MSG)
 
     @property
     def is_tomorrow(self) -> bool:
@@ -156,7 +177,4 @@ class WorkingDayUnit(DayUnit):
 
         Use explicit window checks via `in_(start, end)`, e.g., `in_(1, 2)`.
         """
-        raise ValueError(
-            "Unsupported on working days: weekends/holidays break contiguity. "
-            "Use explicit window checks via in_(start, end), e.g., in_(1, 2)."
-        )
+        raise ValueError(_TOMORROW_MSG)
@@ -15,6 +15,8 @@ from .._util import in_half_open
 class YearUnit(UnitName[CalProtocol]):
     """Year-specific unit implementing year half-open logic."""
 
+    __slots__ = ()
+
     def __init__(self, cal: CalProtocol) -> None:
         super().__init__(cal)
 
@@ -0,0 +1,18 @@
+"""
+Shared BizPolicy error-message fragments used by pytest.raises(match=...).
+
+Keeping these strings in one place means a wording change in
+src/frist/_biz_policy.py is updated once here rather than hunted down
+across the policy test files (and a copy-paste typo in one file can't
+silently diverge from the others).
+"""
+
+HOLIDAY_MSG = "is_holiday expects str"
+WEEKEND_MSG = "is_weekend expects int, date, or datetime"
+WORKDAY_MSG = "is_workday expects int, date, or datetime"
+BUSINESS_DAY_MSG = "is_business_day expects date, or datetime"
+FISCAL_MSG = "fiscal_year_start_month must be in 1..12"
+WORKDAYS_LIST_MSG = "workdays must be a list"
+WORKDAYS_LEN_MSG = "workdays must have 0 to 7 values"
+WORKDAYS_VALUES_MSG = "workdays must contain only integers 0..6"
+HOLIDAYS_SET_MSG = "holidays must be a set"
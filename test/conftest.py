@@ -0,0 +1,48 @@
+"""
+Shared fixtures for the frist test suite.
+
+Centralizes the reference datetime used by the golden/shortcut tests and
+provides prebuilt `Cal`/`Biz` instances so read-only tests do not rebuild
+identical objects for every parametrize row.
+"""
+import datetime as dt
+
+import pytest
+
+from frist import Biz, BizPolicy, Cal, Chrono
+
+# Monday, Jan 13 2025 (week starts Monday) - stable week/month/quarter/year boundaries.
+REF = dt.datetime(2025, 1, 13, 12, 0)
+
+
+@pytest.fixture(scope="session")
+def ref() -> dt.datetime:
+    """Session-wide reference datetime shared by the shortcut/golden tests."""
+    return REF
+
+
+@pytest.fixture(scope="session")
+def cal_ref() -> Cal:
+    """Prebuilt Cal with target == ref; safe to share (read-only in tests)."""
+    return Cal(target_dt=REF, ref_dt=REF)
+
+
+@pytest.fixture(scope="session")
+def default_biz_policy() -> BizPolicy:
+    """Session-wide default BizPolicy for tests that treat it as read-only."""
+    return BizPolicy()
+
+
+@pytest.fixture(scope="session")
+def biz_ref(default_biz_policy: BizPolicy) -> Biz:
+    """Prebuilt Biz with target == ref and the default policy."""
+    return Biz(target_dt=REF, ref_dt=REF, policy=default_biz_policy)
+
+
+@pytest.fixture(scope="session")
+def chrono_fixed() -> Chrono:
+    """Prebuilt Chrono (2024-01-01 noon vs 2024-01-02 noon) for read-only tests."""
+    return Chrono(
+        target_dt=dt.datetime(2024, 1, 1, 12, 0, 0),
+        ref_dt=dt.datetime(2024, 1, 2, 12, 0, 0),
+    )
@@ -0,0 +1,31 @@
+"""
+Opt-in micro-benchmarks guarding the string-parsing fast paths.
+
+Excluded from the default run (see `-m "not bench"` in addopts); run with
+`pytest -m bench --benchmark-compare-fail=mean:10%` to compare against a saved
+baseline so the fromisoformat/regex fast paths cannot silently regress.
+"""
+
+import datetime as dt
+
+import pytest
+
+from frist import Chrono
+from frist._age import Age
+
+pytest.importorskip("pytest_benchmark")
+
+_START = dt.datetime(2020, 6, 15, 14, 30, 45)
+_END = dt.datetime(2023, 9, 22, 9, 15, 30)
+
+
+@pytest.mark.bench
+def test_bench_parse_iso(benchmark):
+    """Benchmark Chrono.parse on an ISO 8601 datetime string (fast path)."""
+    benchmark(Chrono.parse, "2024-01-15T14:30:45")
+
+
+@pytest.mark.bench
+def test_bench_age_init(benchmark):
+    """Benchmark Age construction from datetime operands."""
+    benchmark(Age, _START, _END)
@@ -449,3 +449,16 @@ def test_parametrized_fractional_days_signed(
     b_rev = Biz(end, start, policy)
     assert b_rev.working_days == approx(-expected_working, rel=1e-9)
     assert b_rev.business_days == approx(-expected_business, rel=1e-9)
+
+
+def test_fiscal_batch_helpers_match_scalar() -> None:
+    """Biz.fiscal_quarters/fiscal_years match per-instance properties."""
+    policy = BizPolicy(fiscal_year_start_month=4)
+    ref = dt.datetime(2025, 7, 15, 12, 0)
+    dts = [dt.datetime(2025, m, 15) for m in range(1, 13)]
+
+    expected_quarters = [Biz(d, ref, policy).fiscal_quarter for d in dts]
+    expected_years = [Biz(d, ref, policy).fiscal_year for d in dts]
+
+    assert Biz.fiscal_quarters(dts, policy) == expected_quarters
+    assert Biz.fiscal_years(dts, policy) == expected_years
@@ -71,8 +71,7 @@ def test_business_days_signed_when_target_after_ref_edge() -> None:
     reverse = Biz(target_dt=target, ref_dt=ref)
 
     # Act/Assert
-    import pytest as _pytest
-    assert reverse.business_days == _pytest.approx(-forward.business_days, rel=1e-9)
+    assert reverse.business_days == pytest.approx(-forward.business_days, rel=1e-9)
 
 
 def test_move_n_days_zero_returns_same_date() -> None:
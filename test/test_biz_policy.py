@@ -10,6 +10,8 @@ import pytest
 
 from frist._biz_policy import BizPolicy
 
+from _error_messages import BUSINESS_DAY_MSG, HOLIDAYS_SET_MSG, HOLIDAY_MSG, WORKDAYS_LIST_MSG
+
 
 def test_is_holiday_str():
     """
@@ -44,6 +46,22 @@ def test_is_holiday_datetime():
     assert policy.is_holiday(dt_obj) is True, f"is_holiday({dt_obj}) should be True"
     assert policy.is_holiday(dt.datetime(2025, 1, 1, 0, 0)) is False, "is_holiday(2025-01-01 00:00) should be False"
 
+def test_is_holiday_with_date_and_datetime_elements():
+    """
+    Test that holidays may be supplied as dates or datetimes, not just strings.
+    """
+    # Arrange
+    policy = BizPolicy(
+        holidays={dt.date(2025, 11, 13), dt.datetime(2025, 12, 25, 9, 30), "2025-01-01"}
+    )
+    # Act & Assert - every query form agrees regardless of element form
+    assert policy.is_holiday(dt.date(2025, 11, 13)) is True, "date element should match date query"
+    assert policy.is_holiday("2025-11-13") is True, "date element should match string query"
+    assert policy.is_holiday(dt.datetime(2025, 12, 25, 0, 0)) is True, "datetime element should match by date"
+    assert policy.is_holiday("2025-12-25") is True, "datetime element should match string query"
+    assert policy.is_holiday(dt.date(2025, 1, 1)) is True, "string element should match date query"
+    assert policy.is_holiday(dt.date(2025, 6, 1)) is False, "non-holiday should be False"
+
 def test_is_holiday_invalid_type():
     """
     Test is_holiday raises TypeError for invalid input types.
@@ -51,41 +69,26 @@ def test_is_holiday_invalid_type():
     # Arrange
     policy = BizPolicy()
     # Act & Assert
-    with pytest.raises(TypeError, match="is_holiday expects str"):
+    with pytest.raises(TypeError, match=HOLIDAY_MSG):
         policy.is_holiday(12345)  #type: ignore # Intentional wrong type for test
-    with pytest.raises(TypeError, match="is_holiday expects str"):
+    with pytest.raises(TypeError, match=HOLIDAY_MSG):
         policy.is_holiday(["2025-11-13"]) #type: ignore # Intentional wrong type for test
 
-def test_calendar_policy_invalid_workdays_type() -> None:
+@pytest.mark.parametrize("bad_workdays", [(0, 1, 2, 3, 4), "01234", None])
+def test_calendar_policy_invalid_workdays_type(bad_workdays) -> None:
     """
     Test that BizPolicy raises TypeError if workdays is not a list.
     """
-    with pytest.raises(TypeError, match="workdays must be a list"):
-        BizPolicy(workdays=(0, 1, 2, 3, 4))  # type: ignore # should be bad type
-    with pytest.raises(TypeError, match="workdays must be a list"):
-        BizPolicy(workdays="01234")  # type:ignore # should be bad type
-    with pytest.raises(TypeError, match="workdays must be a list"):
-        BizPolicy(workdays=None)  # type:ignore # should be bad type
+    with pytest.raises(TypeError, match=WORKDAYS_LIST_MSG):
+        BizPolicy(workdays=bad_workdays)  # type: ignore # should be bad type
 
-def test_calendar_policy_invalid_holidays_type() -> None:
+@pytest.mark.parametrize("bad_holidays", [["2025-11-13"], "2025-11-13", None])
+def test_calendar_policy_invalid_holidays_type(bad_holidays) -> None:
     """
     Test that BizPolicy raises TypeError if holidays is not a set.
     """
-    with pytest.raises(TypeError, match="holidays must be a set"):
-        BizPolicy(holidays=["2025-11-13"])  # type:ignore # should be bad type
-    with pytest.raises(TypeError, match="holidays must be a set"):
-        BizPolicy(holidays="2025-11-13")  # type:ignore # should be bad type
-    with pytest.raises(TypeError, match="holidays must be a set"):
-        BizPolicy(holidays=None)  # type:ignore # should be bad type
-
-def test_calendar_policy_invalid_fiscal_year_start_month() -> None:
-    """
-    Test that BizPolicy raises ValueError for invalid fiscal_year_start_month (coverage for __post_init__ line 31).
-    """
-    with pytest.raises(ValueError, match="fiscal_year_start_month must be in 1..12"):
-        BizPolicy(fiscal_year_start_month=0)
-    with pytest.raises(ValueError, match="fiscal_year_start_month must be in 1..12"):
-        BizPolicy(fiscal_year_start_month=13)
+    with pytest.raises(TypeError, match=HOLIDAYS_SET_MSG):
+        BizPolicy(holidays=bad_holidays)  # type: ignore # should be bad type
 
 @pytest.mark.parametrize("good_date", [
     "1900-01-01",
@@ -102,11 +105,11 @@ def test_is_business_day_invalid_type():
     Test is_business_day raises TypeError for invalid input types.
     """
     policy = BizPolicy()
-    with pytest.raises(TypeError, match="is_business_day expects date, or datetime"):
+    with pytest.raises(TypeError, match=BUSINESS_DAY_MSG):
         policy.is_business_day(12345)  # type: ignore
-    with pytest.raises(TypeError, match="is_business_day expects date, or datetime"):
+    with pytest.raises(TypeError, match=BUSINESS_DAY_MSG):
         policy.is_business_day("2025-11-13")  # type: ignore
-    with pytest.raises(TypeError, match="is_business_day expects date, or datetime"):
+    with pytest.raises(TypeError, match=BUSINESS_DAY_MSG):
         policy.is_business_day([dt.date(2025, 11, 13)])  # type: ignore
 
 @pytest.mark.parametrize("bad_str", [
@@ -124,21 +127,21 @@ def test_is_holiday_valueerror_for_bad_str(bad_str):
 
 def test_is_business_day_typeerror():
     policy = BizPolicy()
-    with pytest.raises(TypeError, match="is_business_day expects date, or datetime"):
+    with pytest.raises(TypeError, match=BUSINESS_DAY_MSG):
         policy.is_business_day(42)  # int, not date/datetime
-    with pytest.raises(TypeError, match="is_business_day expects date, or datetime"):
+    with pytest.raises(TypeError, match=BUSINESS_DAY_MSG):
         policy.is_business_day("2025-11-13")   # type: ignore # Intentional wrong type for test
 
 def test_is_holiday_typeerror():
     policy = BizPolicy()
-    with pytest.raises(TypeError, match="is_holiday expects str"):
+    with pytest.raises(TypeError, match=HOLIDAY_MSG):
         policy.is_holiday(42)  # int, not str/date/datetime
-    with pytest.raises(TypeError, match="is_holiday expects str"):
+    with pytest.raises(TypeError, match=HOLIDAY_MSG):
         policy.is_holiday([2025, 11, 13])  # type: ignore # Intentional wrong type for test
 
 def test_is_business_day_typeerror_none():
     policy = BizPolicy()
-    with pytest.raises(TypeError, match="is_business_day expects date, or datetime"):
+    with pytest.raises(TypeError, match=BUSINESS_DAY_MSG):
         policy.is_business_day(None)   # type: ignore # Intentional wrong type for test
 
 def test_is_business_day_true_false():
@@ -7,36 +7,23 @@ import pytest
 
 from frist._biz_policy import BizPolicy
 
+from _error_messages import HOLIDAY_MSG, WEEKEND_MSG, WORKDAY_MSG
 
-def make_policy():
-    return BizPolicy(holidays={"2025-11-13"})
+# One policy instance suffices; the methods under test do not mutate it.
+_POLICY = BizPolicy(holidays={"2025-11-13"})
 
-def test_is_weekend_typeerror() -> None:
-    """
-    Test is_weekend raises TypeError for invalid input types.
-    """
-    policy = make_policy()
-    with pytest.raises(TypeError, match="is_weekend expects int, date, or datetime"):
-        policy.is_weekend("not-a-date")
-    with pytest.raises(TypeError, match="is_weekend expects int, date, or datetime"):
-        policy.is_weekend([1, 2, 3])
-
-def test_is_workday_typeerror() -> None:
-    """
-    Test is_workday raises TypeError for invalid input types.
-    """
-    policy = make_policy()
-    with pytest.raises(TypeError, match="is_workday expects int, date, or datetime"):
-        policy.is_workday("not-a-date")
-    with pytest.raises(TypeError, match="is_workday expects int, date, or datetime"):
-        policy.is_workday([1, 2, 3])
 
-def test_is_holiday_typeerror() -> None:
+@pytest.mark.parametrize("method, bad_input, match", [
+    ("is_weekend", "not-a-date", WEEKEND_MSG),
+    ("is_weekend", [1, 2, 3], WEEKEND_MSG),
+    ("is_workday", "not-a-date", WORKDAY_MSG),
+    ("is_workday", [1, 2, 3], WORKDAY_MSG),
+    ("is_holiday", 12345, HOLIDAY_MSG),
+    ("is_holiday", ["2025-11-13"], HOLIDAY_MSG),
+])
+def test_policy_method_typeerror(method: str, bad_input, match: str) -> None:
     """
-    Test is_holiday raises TypeError for invalid input types.
+    Test that BizPolicy predicate methods raise TypeError for invalid input types.
     """
-    policy = make_policy()
-    with pytest.raises(TypeError, match="is_holiday expects str"):
-        policy.is_holiday(12345)
-    with pytest.raises(TypeError, match="is_holiday expects str"):
-        policy.is_holiday(["2025-11-13"])
+    with pytest.raises(TypeError, match=match):
+        getattr(_POLICY, method)(bad_input)
@@ -5,30 +5,26 @@ import pytest
 
 from frist._biz_policy import BizPolicy
 
+from _error_messages import HOLIDAY_MSG, WEEKEND_MSG, WORKDAYS_LEN_MSG, WORKDAYS_VALUES_MSG, WORKDAY_MSG
 
-def test_invalid_fiscal_year_start_month_exception() -> None:
-    """
-    Test that invalid fiscal_year_start_month raises ValueError.
-    """
-    with pytest.raises(ValueError, match="fiscal_year_start_month must be in 1..12"):
-        BizPolicy(fiscal_year_start_month=0)
-    with pytest.raises(ValueError, match="fiscal_year_start_month must be in 1..12"):
-        BizPolicy(fiscal_year_start_month=13)
+
+# fiscal_year_start_month validation is covered (parametrized) in
+# test_biz_policy_post_init.py; duplicates removed from this file.
 
 def test_invalid_workdays_length_exception() -> None:
     """
     Test that workdays longer than 7 raises ValueError.
     """
-    with pytest.raises(ValueError, match="workdays must have 0 to 7 values"):
+    with pytest.raises(ValueError, match=WORKDAYS_LEN_MSG):
         BizPolicy(workdays=list(range(8)))
 
 def test_invalid_workdays_value_exception() -> None:
     """
     Test that workdays with values outside 0..6 raises ValueError.
     """
-    with pytest.raises(ValueError, match="workdays must contain only integers 0..6"):
+    with pytest.raises(ValueError, match=WORKDAYS_VALUES_MSG):
         BizPolicy(workdays=[-1, 0, 1])
-    with pytest.raises(ValueError, match="workdays must contain only integers 0..6"):
+    with pytest.raises(ValueError, match=WORKDAYS_VALUES_MSG):
         BizPolicy(workdays=[0, 1, 2, 3, 4, 5, 7])
 
 def test_is_holiday_typeerror() -> None:
@@ -36,9 +32,9 @@ def test_is_holiday_typeerror() -> None:
     Test is_holiday raises TypeError for invalid input types.
     """
     policy = BizPolicy()
-    with pytest.raises(TypeError, match="is_holiday expects str"):
+    with pytest.raises(TypeError, match=HOLIDAY_MSG):
         policy.is_holiday(12345)
-    with pytest.raises(TypeError, match="is_holiday expects str"):
+    with pytest.raises(TypeError, match=HOLIDAY_MSG):
         policy.is_holiday(["2025-11-13"])
 
 def test_is_workday_typeerror() -> None:
@@ -46,9 +42,9 @@ def test_is_workday_typeerror() -> None:
     Test is_workday raises TypeError for invalid input types.
     """
     policy = BizPolicy()
-    with pytest.raises(TypeError, match="is_workday expects int, date, or datetime"):
+    with pytest.raises(TypeError, match=WORKDAY_MSG):
         policy.is_workday("not-a-date")
-    with pytest.raises(TypeError, match="is_workday expects int, date, or datetime"):
+    with pytest.raises(TypeError, match=WORKDAY_MSG):
         policy.is_workday([1, 2, 3])
 
 def test_is_weekend_typeerror() -> None:
@@ -56,7 +52,7 @@ def test_is_weekend_typeerror() -> None:
     Test is_weekend raises TypeError for invalid input types.
     """
     policy = BizPolicy()
-    with pytest.raises(TypeError, match="is_weekend expects int, date, or datetime"):
+    with pytest.raises(TypeError, match=WEEKEND_MSG):
         policy.is_weekend("not-a-date")
-    with pytest.raises(TypeError, match="is_weekend expects int, date, or datetime"):
+    with pytest.raises(TypeError, match=WEEKEND_MSG):
         policy.is_weekend([1, 2, 3])
@@ -7,6 +7,8 @@ import pytest
 
 from frist._biz_policy import BizPolicy
 
+from _error_messages import FISCAL_MSG, WORKDAYS_LEN_MSG, WORKDAYS_VALUES_MSG
+
 
 def test_valid_calendar_policy() -> None:
     """
@@ -18,29 +20,31 @@ def test_valid_calendar_policy() -> None:
     BizPolicy(fiscal_year_start_month=6, workdays=[])
     BizPolicy(fiscal_year_start_month=7, workdays=[0, 1, 2, 3, 4, 5, 6])
 
-def test_invalid_fiscal_year_start_month() -> None:
+@pytest.mark.parametrize("bad_month", [0, 13, -1, 100])
+def test_invalid_fiscal_year_start_month(bad_month: int) -> None:
     """
     Test that invalid fiscal_year_start_month values raise ValueError.
+
+    Canonical home for this check; duplicates in test_biz_policy.py and
+    test_biz_policy_exceptions_full.py were removed.
     """
-    with pytest.raises(ValueError, match="fiscal_year_start_month must be in 1..12"):
-        BizPolicy(fiscal_year_start_month=0)
-    with pytest.raises(ValueError, match="fiscal_year_start_month must be in 1..12"):
-        BizPolicy(fiscal_year_start_month=13)
+    with pytest.raises(ValueError, match=FISCAL_MSG):
+        BizPolicy(fiscal_year_start_month=bad_month)
 
 def test_invalid_workdays_length() -> None:
     """
     Test that workdays longer than 7 raise ValueError.
     """
-    with pytest.raises(ValueError, match="workdays must have 0 to 7 values"):
+    with pytest.raises(ValueError, match=WORKDAYS_LEN_MSG):
         BizPolicy(workdays=list(range(8)))
 
 def test_invalid_workdays_values() -> None:
     """
     Test that workdays with values outside 0..6 raise ValueError.
     """
-    with pytest.raises(ValueError, match="workdays must contain only integers 0..6"):
+    with pytest.raises(ValueError, match=WORKDAYS_VALUES_MSG):
         BizPolicy(workdays=[-1, 0, 1])
-    with pytest.raises(ValueError, match="workdays must contain only integers 0..6"):
+    with pytest.raises(ValueError, match=WORKDAYS_VALUES_MSG):
         BizPolicy(workdays=[0, 1, 2, 3, 4, 5, 7])
     with pytest.raises(ValueError, match="workdays must have 0 to 7 values, got 8"):
         BizPolicy(workdays=[0, 1, 2, 3, 4, 5, 6, 7])
@@ -8,79 +8,107 @@ Shortcuts covered:
              is_workday_yesterday / is_workday_today / is_workday_tomorrow
 - Fiscal: is_last_fiscal_quarter / is_this_fiscal_quarter / is_next_fiscal_quarter
           is_last_fiscal_year / is_this_fiscal_year / is_next_fiscal_year
+
+Each (shortcut, position) pair is its own parametrized case so a failure on one
+boundary does not mask the remaining four positions.
 """
 from __future__ import annotations
 
 import datetime as dt
+from operator import attrgetter
 
-from frist import Biz, BizPolicy
-
+import pytest
 
-def _check_five_biz(prop: str, ref: dt.datetime, policy: BizPolicy,
-                    dt_below: dt.datetime, dt_on_lower: dt.datetime,
-                    dt_above_lower: dt.datetime, dt_on_upper: dt.datetime,
-                    dt_above_upper: dt.datetime) -> None:
-    """Assert five-case expectations for Biz(...).{prop} given `ref` and `policy`.
+from frist import Biz, BizPolicy
 
-    Uses `getattr(Biz(t, ref, policy), prop)` to evaluate the boolean.
+# Fixed offsets used below, allocated once at import.
+_DAY1 = dt.timedelta(days=1)
+_HALF_DAY = dt.timedelta(hours=12)
+
+# Shared policies; constructed once for the whole module.
+_DEFAULT_POLICY = BizPolicy()  # default Mon-Fri workdays, no holidays
+_APRIL_FY_POLICY = BizPolicy(fiscal_year_start_month=4)
+
+# Wednesday reference for the day-level shortcuts.
+_DAY_REF = dt.datetime(2025, 1, 15, 12, 0)
+# Mid-quarter reference for the fiscal shortcuts (FY starts April).
+_FISCAL_REF = dt.datetime(2025, 7, 15, 12, 0)
+
+# Start of the day containing _DAY_REF; the day-level shortcut windows are
+# derived from it rather than written out by hand.
+_DAY_START = dt.datetime(2025, 1, 15)
+
+# Half-open window [lower, upper) per shortcut, plus the ref/policy it is
+# evaluated against. The five boundary targets are computed mechanically by
+# five_boundaries() instead of being hand-written per unit.
+WINDOWS: dict[str, tuple[dt.datetime, BizPolicy, tuple[dt.datetime, dt.datetime]]] = {
+    "is_business_day_today": (
+        _DAY_REF, _DEFAULT_POLICY, (_DAY_START, _DAY_START + _DAY1)),
+    "is_workday_today": (
+        _DAY_REF, _DEFAULT_POLICY, (_DAY_START, _DAY_START + _DAY1)),
+    "is_last_fiscal_quarter": (
+        _FISCAL_REF, _APRIL_FY_POLICY, (dt.datetime(2025, 4, 1), dt.datetime(2025, 7, 1))),
+    "is_this_fiscal_quarter": (
+        _FISCAL_REF, _APRIL_FY_POLICY, (dt.datetime(2025, 7, 1), dt.datetime(2025, 10, 1))),
+    "is_last_fiscal_year": (
+        _FISCAL_REF, _APRIL_FY_POLICY, (dt.datetime(2024, 4, 1), dt.datetime(2025, 4, 1))),
+    "is_this_fiscal_year": (
+        _FISCAL_REF, _APRIL_FY_POLICY, (dt.datetime(2025, 4, 1), dt.datetime(2026, 4, 1))),
+}
+
+
+def five_boundaries(lower: dt.datetime,
+                    upper: dt.datetime) -> tuple[dt.datetime, ...]:
+    """Return the five canonical probe datetimes for a half-open window.
+
+    Order: below-lower, on-lower, interior midpoint, on-upper (excluded),
+    above-upper.
     """
-    # Arrange & Act
-    def actual(t: dt.datetime) -> bool:
-        return getattr(Biz(t, ref, policy), prop)
-
-    # Assert
-    expected = [False, True, True, False, False]
-    actuals = [
-        actual(dt_below),
-        actual(dt_on_lower),
-        actual(dt_above_lower),
-        actual(dt_on_upper),
-        actual(dt_above_upper)
-    ]
-    assert actuals[0] is expected[0], (
-        f"{prop}: below-lower should be False ({dt_below})"
+    return (
+        lower - _HALF_DAY,
+        lower,
+        lower + (upper - lower) / 2,
+        upper,
+        upper + _HALF_DAY,
     )
-    assert actuals[1] is expected[1], (
-        f"{prop}: on-lower should be True ({dt_on_lower})"
-    )
-    assert actuals[2] is expected[2], (
-        f"{prop}: above-lower (interior) should be True ({dt_above_lower})"
-    )
-    assert actuals[3] is expected[3], (
-        f"{prop}: on-upper should be False (exclusive) ({dt_on_upper})"
-    )
-    assert actuals[4] is expected[4], (
-        f"{prop}: above-upper should be False ({dt_above_upper})"
+
+# Property getters resolved once at import; attrgetter caches the attribute
+# name at the C level instead of doing a getattr name lookup per case.
+_SHORTCUT_GETTERS = {
+    name: attrgetter(name)
+    for name in (
+        "is_business_day_today",
+        "is_workday_today",
+        "is_last_fiscal_quarter",
+        "is_this_fiscal_quarter",
+        "is_last_fiscal_year",
+        "is_this_fiscal_year",
     )
+}
+
+# Boundary position index into the five-tuple and its expected truth value.
+_POSITIONS = [
+    pytest.param(0, False, id="below-lower"),
+    pytest.param(1, True, id="on-lower"),
+    pytest.param(2, True, id="above-lower"),
+    pytest.param(3, False, id="on-upper"),
+    pytest.param(4, False, id="above-upper"),
+]
+
+
+@pytest.mark.parametrize("position, expected", _POSITIONS)
+@pytest.mark.parametrize("prop", WINDOWS, ids=WINDOWS)
+def test_shortcut_five_cases(prop: str, position: int, expected: bool) -> None:
+    """Each shortcut boundary position is an independent parametrized case."""
+    # Arrange
+    ref, policy, window = WINDOWS[prop]
+    target = five_boundaries(*window)[position]
 
+    # Act
+    actual = _SHORTCUT_GETTERS[prop](Biz(target, ref, policy))
 
-def test_day_shortcuts_five_cases() -> None:
-    """Day-level business/workday shortcuts five-case coverage."""
-    """
-    Day-level business/workday shortcuts five-case coverage.
-    """
-    # Arrange
-    ref = dt.datetime(2025, 1, 15, 12, 0)  # Wednesday
-    policy = BizPolicy()  # default Mon-Fri workdays, no holidays
-    lower_date = ref.date()
-    upper_date = ref.date() + dt.timedelta(days=1)
-    dt_below = dt.datetime.combine(lower_date - dt.timedelta(days=1), dt.time(12, 0))
-    dt_on_lower = dt.datetime.combine(lower_date, dt.time(12, 0))
-    dt_above_lower = dt.datetime.combine(lower_date, dt.time(18, 0))
-    dt_on_upper = dt.datetime.combine(upper_date, dt.time(12, 0))
-    dt_above_upper = dt.datetime.combine(
-        upper_date + dt.timedelta(days=1), dt.time(12, 0)
-    )
-    # Act & Assert
-    # Act & Assert
-    _check_five_biz(
-        "is_business_day_today", ref, policy,
-        dt_below, dt_on_lower, dt_above_lower, dt_on_upper, dt_above_upper
-    )
-    _check_five_biz(
-        "is_workday_today", ref, policy,
-        dt_below, dt_on_lower, dt_above_lower, dt_on_upper, dt_above_upper
-    )
+    # Assert
+    assert actual is expected, f"{prop}: position {position} ({target})"
 
 
 def test_business_vs_workday_holiday_shortcuts() -> None:
@@ -90,9 +118,6 @@ def test_business_vs_workday_holiday_shortcuts() -> None:
     reference 2025-07-07 will be Thursday 2025-07-03 (the holiday is skipped),
     but the workday shortcut will still consider the holiday a workday.
     """
-    """
-    Show difference between business and workday shortcuts when a holiday is present.
-    """
     # Arrange
     ref = dt.datetime(2025, 7, 7, 12, 0)  # Monday
     policy = BizPolicy(holidays={"2025-07-04"})
@@ -108,65 +133,3 @@ def test_business_vs_workday_holiday_shortcuts() -> None:
     assert actual_business_last_day_thu is expected_business_last_day_thu
     assert actual_business_last_day_fri is expected_business_last_day_fri
     assert actual_workday_last_day_fri is expected_workday_last_day_fri
-
-
-def test_fiscal_quarter_shortcuts_five_cases() -> None:
-    """Fiscal-quarter shortcuts five-case coverage (fiscal year start = April)."""
-    """
-    Fiscal-quarter shortcuts five-case coverage (fiscal year start = April).
-    """
-    # Arrange
-    policy = BizPolicy(fiscal_year_start_month=4)
-    ref = dt.datetime(2025, 7, 15, 12, 0)
-    # Act & Assert
-    _check_five_biz(
-        "is_last_fiscal_quarter",
-        ref,
-        policy,
-        dt.datetime(2025, 1, 15, 12, 0),
-        dt.datetime(2025, 4, 1, 12, 0),
-        dt.datetime(2025, 5, 15, 12, 0),
-        dt.datetime(2025, 7, 1, 0, 0),
-        dt.datetime(2025, 8, 1, 12, 0),
-    )
-    _check_five_biz(
-        "is_this_fiscal_quarter",
-        ref,
-        policy,
-        dt.datetime(2025, 6, 30, 23, 59),
-        dt.datetime(2025, 7, 1, 12, 0),
-        dt.datetime(2025, 8, 15, 12, 0),
-        dt.datetime(2025, 10, 1, 0, 0),
-        dt.datetime(2025, 12, 1, 12, 0),
-    )
-
-
-def test_fiscal_year_shortcuts_five_cases() -> None:
-    """Fiscal-year shortcuts five-case coverage (fiscal year start = April)."""
-    """
-    Fiscal-year shortcuts five-case coverage (fiscal year start = April).
-    """
-    # Arrange
-    policy = BizPolicy(fiscal_year_start_month=4)
-    ref = dt.datetime(2025, 7, 15, 12, 0)
-    # Act & Assert
-    _check_five_biz(
-        "is_last_fiscal_year",
-        ref,
-        policy,
-        dt.datetime(2023, 12, 31, 12, 0),
-        dt.datetime(2024, 4, 1, 12, 0),
-        dt.datetime(2024, 10, 1, 12, 0),
-        dt.datetime(2025, 4, 1, 0, 0),
-        dt.datetime(2026, 6, 1, 12, 0),
-    )
-    _check_five_biz(
-        "is_this_fiscal_year",
-        ref,
-        policy,
-        dt.datetime(2025, 3, 31, 23, 59),
-        dt.datetime(2025, 4, 1, 0, 0),
-        dt.datetime(2025, 10, 1, 12, 0),
-        dt.datetime(2026, 4, 1, 0, 0),
-        dt.datetime(2027, 1, 1, 12, 0),
-    )
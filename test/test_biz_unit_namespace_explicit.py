@@ -7,14 +7,20 @@ offset for each unit.
 
 import datetime as dt
 
+import pytest
+
 from frist._biz import Biz
 
 
-def test_biz_unit_unit_explicit_checks():
-    # Arrange
-    # Use a weekday (Friday) so business/working-day checks are True
+@pytest.fixture(scope="module")
+def biz() -> Biz:
+    """Shared read-only Biz on a weekday (Friday) ref so business checks hold."""
     ref = dt.datetime(2025, 3, 14, 12, 34, 56)
-    biz = Biz(target_dt=ref, ref_dt=ref)
+    return Biz(target_dt=ref, ref_dt=ref)
+
+
+def test_biz_unit_unit_explicit_checks(biz: Biz):
+    # Arrange handled by the module-scoped `biz` fixture.
 
     # Act / Assert: business days
     assert biz.biz_day.in_(0) is True
@@ -19,19 +19,21 @@ UNITS = [
     "fis_year",
 ]
 
+@pytest.fixture(scope="module")
+def biz_wd() -> Biz:
+    """Shared read-only Biz on a weekday ref for stable expectations."""
+    weekday_ref = dt.datetime(2025, 3, 14, 12, 0, 0)  # Friday
+    return Biz(target_dt=weekday_ref, ref_dt=weekday_ref)
+
+
 @pytest.mark.smoke
-def test_biz_unit_unit_smoke():
-    # Arrange
-    ref = dt.datetime(2025, 3, 15, 12, 34, 56)
-    biz = Biz(target_dt=ref, ref_dt=ref)
-
-    # Act / Assert: iterate units and verify golden boolean expectations
-    for unit in UNITS:
-        ns = getattr(biz, unit)
-
-        # Use a weekday ref for stable expectations
-        weekday_ref = dt.datetime(2025, 3, 14, 12, 0, 0)  # Friday
-        biz_wd = Biz(target_dt=weekday_ref, ref_dt=weekday_ref)
-        ns_wd = getattr(biz_wd, unit)
-        assert ns_wd.in_(0) is True
-        assert ns_wd.in_(-1) is False
+@pytest.mark.parametrize("unit", UNITS)
+def test_biz_unit_unit_smoke(biz_wd: Biz, unit: str):
+    # Arrange handled by the module-scoped `biz_wd` fixture.
+
+    # Act
+    ns_wd = getattr(biz_wd, unit)
+
+    # Assert: golden boolean expectations per unit
+    assert ns_wd.in_(0) is True
+    assert ns_wd.in_(-1) is False
@@ -10,6 +10,13 @@ import pytest
 
 from frist import BizPolicy, Cal, Chrono
 
+# Next-quarter-start lookup: month -> (start_month, year_delta). Table-driven
+# so boundary targets need no modular month arithmetic or year-wrap branch.
+_NEXT_QUARTER_START = {
+    m: ((((m - 1) // 3 + 1) * 3) % 12 + 1, 1 if m >= 10 else 0)
+    for m in range(1, 13)
+}
+
 # Local fixture for Cal instance
 
 
@@ -54,9 +61,7 @@ def test_hour_interval_half_open():
     """Test hour interval is half-open: start <= value < end."""
     # Arrange
     ref_dt: dt.datetime = dt.datetime(2024, 1, 1, 12, 0, 0)
-    value: dt.datetime = ref_dt.replace(
-        minute=0, second=0, microsecond=0
-    ) + dt.timedelta(hours=1)
+    value: dt.datetime = dt.datetime(2024, 1, 1, 13, 0, 0)  # start of next hour
     z: Chrono = Chrono(target_dt=value, ref_dt=ref_dt)
     cal: Cal = z.cal
     # Act
@@ -71,9 +76,8 @@ def test_quarter_interval_half_open():
     """Test quarter interval is half-open: start <= value < end."""
     # Arrange
     ref_dt: dt.datetime = dt.datetime(2024, 1, 1, 12, 0, 0)
-    value: dt.datetime = ref_dt.replace(
-        month=4, day=1, hour=0, minute=0, second=0, microsecond=0
-    )  # Q2 start
+    nq_month, year_delta = _NEXT_QUARTER_START[ref_dt.month]
+    value: dt.datetime = dt.datetime(ref_dt.year + year_delta, nq_month, 1)  # Q2 start
 
     z: Chrono = Chrono(target_dt=value, ref_dt=ref_dt)
     cal: Cal = z.cal
@@ -41,38 +41,52 @@ def test_cal_init_numeric_and_typeerror() -> None:
         Cal(target_dt=ref, ref_dt="bad")
 
 
-def test_cal_shortcut_properties_delegate_to_methods() -> None:
-    """Test that Cal shortcut properties delegate to in_() methods correctly."""
+# Shortcut property list frozen at module scope; expectations are golden values
+# for target == reference (all 'this' shortcuts True, all last/next False).
+# Each row is (shortcut, delegated unit, unit offset, golden expectation).
+_SHORTCUT_REF = dt.datetime(2025, 4, 10, 12, 0, 0)
+_CAL_AT_REF = Cal(target_dt=_SHORTCUT_REF, ref_dt=_SHORTCUT_REF)
+_SHORTCUT_EXPECTATIONS = [
+    ("is_today", "day", 0, True),
+    ("is_this_week", "week", 0, True),
+    ("is_this_month", "month", 0, True),
+    ("is_this_quarter", "qtr", 0, True),
+    ("is_this_year", "year", 0, True),
+    ("is_last_week", "week", -1, False),
+    ("is_next_week", "week", 1, False),
+    ("is_last_month", "month", -1, False),
+    ("is_next_month", "month", 1, False),
+    ("is_last_quarter", "qtr", -1, False),
+    ("is_next_quarter", "qtr", 1, False),
+    ("is_last_year", "year", -1, False),
+    ("is_next_year", "year", 1, False),
+]
+
+# Delegated in_() results computed once; the parametrized test compares each
+# shortcut against this table instead of re-invoking in_() per assert.
+_DELEGATED_EXPECTED = {
+    prop: getattr(_CAL_AT_REF, unit).in_(offset)
+    for prop, unit, offset, _ in _SHORTCUT_EXPECTATIONS
+}
+
+
+@pytest.mark.parametrize("prop, unit, offset, expected", _SHORTCUT_EXPECTATIONS)
+def test_cal_shortcut_properties_delegate_to_methods(
+        prop: str, unit: str, offset: int, expected: bool) -> None:
+    """Test that each Cal shortcut matches its delegated in_() golden value."""
+    actual = getattr(_CAL_AT_REF, prop)
+    assert actual is expected, f"{prop} should be {expected} at reference"
+    assert actual == _DELEGATED_EXPECTED[prop], f"{prop} should equal {unit}.in_({offset})"
+
+
+def test_cal_yesterday_tomorrow_shortcuts() -> None:
+    """Test explicit yesterday/tomorrow checks using golden expectations."""
     # Arrange
-    ref = dt.datetime(2025, 4, 10, 12, 0, 0)
-    
-    # Act
-    # choose a target equal to ref for 'this' shortcuts
-    c = Cal(target_dt=ref, ref_dt=ref)
-
-    # Assert
-    # Golden assertions for shortcuts (explicit expectations, not parity checks)
-    assert c.is_today is True, "Target should be today when equal to reference"
-    assert c.is_this_week is True, "Target should be this week when equal to reference"
-    assert c.is_this_month is True, "Target should be this month when equal to reference"
-    assert c.is_this_quarter is True
-    assert c.is_this_year is True
-
-    # last/next variants
-    assert c.is_last_week is False
-    assert c.is_next_week is False
-    assert c.is_last_month is False
-    assert c.is_next_month is False
-    assert c.is_last_quarter is False
-    assert c.is_next_quarter is False
-    assert c.is_last_year is False
-    assert c.is_next_year is False
-
-    # explicit yesterday/tomorrow checks using golden expectations
     ref2 = dt.datetime(2025, 4, 11, 12, 0, 0)
     cal_y = Cal(target_dt=ref2 - dt.timedelta(days=1), ref_dt=ref2)
     cal_t = Cal(target_dt=ref2 + dt.timedelta(days=1), ref_dt=ref2)
 
+    # Act & Assert
     assert cal_y.is_yesterday is True
     assert cal_t.is_tomorrow is True
 
@@ -2,88 +2,125 @@
 Golden (expected) results for Cal shortcut behaviors.
 """
 import datetime as dt
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable
 
 import pytest
 
 from frist import Biz, BizPolicy, Cal
 
-# Use a reference datetime that yields stable week/month/quarter/year boundaries:
-REF = dt.datetime(2025, 1, 13, 12, 0)  # Monday, Jan 13 2025 (week starts Monday)
-
-
-@pytest.mark.parametrize(
-    "shortcut, target_dt, expected",
-    [
-        # day shortcuts
-        ("is_today", dt.datetime(2025, 1, 13, 0, 0), True),
-        ("is_today", dt.datetime(2025, 1, 11, 12, 0), False),
-        ("is_yesterday", dt.datetime(2025, 1, 12, 9, 0), True),
-        ("is_tomorrow", dt.datetime(2025, 1, 14, 9, 0), True),
-        # week shortcuts (ref week = 2025-01-13..2025-01-19)
-        ("is_last_week", dt.datetime(2025, 1, 6, 0, 0), True),   # previous week
-        ("is_this_week", dt.datetime(2025, 1, 15, 0, 0), True),   # same week
-        ("is_next_week", dt.datetime(2025, 1, 20, 0, 0), True),   # next week
-        # month shortcuts (ref month = Jan 2025)
-        ("is_last_month", dt.datetime(2024, 12, 15, 0, 0), True),
-        ("is_this_month", dt.datetime(2025, 1, 5, 0, 0), True),
-        ("is_next_month", dt.datetime(2025, 2, 10, 0, 0), True),
-        # quarter shortcuts (Q1=Jan-Mar for calendar quarters)
-        ("is_last_quarter", dt.datetime(2024, 11, 15, 0, 0), True),  # Q4 2024
-        ("is_this_quarter", dt.datetime(2025, 2, 1, 0, 0), True),    # Q1 2025
-        ("is_next_quarter", dt.datetime(2025, 4, 1, 0, 0), True),    # Q2 2025
-        # year shortcuts
-        ("is_last_year", dt.datetime(2024, 6, 1, 0, 0), True),
-        ("is_this_year", dt.datetime(2025, 7, 1, 0, 0), True),
-        ("is_next_year", dt.datetime(2026, 3, 1, 0, 0), True),
-        # obvious negatives for some units (sanity)
-        ("is_last_month", dt.datetime(2025, 1, 2, 0, 0), False),
-        ("is_this_week", dt.datetime(2025, 1, 6, 0, 0), False),
-    ],
-)
-def test_cal_shortcuts_golden(shortcut: str, target_dt: dt.datetime, expected: bool) -> None:
+from conftest import REF  # shared Monday reference; see test/conftest.py
+
+# Default policy shared across parametrize rows; golden dates are unambiguous.
+_DEFAULT_POLICY = BizPolicy()
+
+
+@lru_cache(maxsize=None)
+def _cal(target_dt: dt.datetime) -> Cal:
+    """Construct (or reuse) a Cal for a golden target; Cal is read-only here."""
+    return Cal(target_dt=target_dt, ref_dt=REF)
+
+
+@lru_cache(maxsize=None)
+def _biz(target_dt: dt.datetime) -> Biz:
+    """Construct (or reuse) a Biz; the policy is the module-level default."""
+    return Biz(target_dt=target_dt, ref_dt=REF, policy=_DEFAULT_POLICY)
+
+
+@pytest.fixture
+def instance(request: pytest.FixtureRequest) -> Cal | Biz:
+    """Build the Cal or Biz under test from an indirect ('cal'|'biz', target) param.
+
+    Construction is routed through lru_cache factories so targets repeated
+    across golden rows (e.g. 2024-06-01 in is_last_year and
+    is_last_fiscal_year) are only constructed once.
     """
-    Test Cal shortcuts with explicit golden datetimes (no parity comparisons).
+    kind, target_dt = request.param
+    return _cal(target_dt) if kind == "cal" else _biz(target_dt)
+
+
+def _golden_cases():
+    """Yield (shortcut, expected, (kind, target_dt)) rows lazily.
+
+    A generator keeps the datetime construction out of module import and
+    scales better than a literal list as the table grows.
     """
-    c = Cal(target_dt=target_dt, ref_dt=REF)
-    assert getattr(c, shortcut) is expected
-
-
-@pytest.mark.parametrize(
-    "shortcut, target_dt, expected",
-    [
-        # business-day / workday shortcuts (today/yesterday/tomorrow)
-        ("is_business_day_today", dt.datetime(2025, 1, 13, 10, 0), True),
-        ("is_business_day_yesterday", dt.datetime(2025, 1, 10, 10, 0), True),
-        ("is_business_day_tomorrow", dt.datetime(2025, 1, 14, 10, 0), True),
-        ("is_workday_today", dt.datetime(2025, 1, 13, 10, 0), True),
-        ("is_workday_yesterday", dt.datetime(2025, 1, 10, 10, 0), True),
-        ("is_workday_tomorrow", dt.datetime(2025, 1, 14, 10, 0), True),
-        # fiscal shortcuts (calendar fiscal year starting Jan)
-        ("is_this_fiscal_quarter", dt.datetime(2025, 2, 1, 0, 0), True),
-        ("is_last_fiscal_quarter", dt.datetime(2024, 11, 15, 0, 0), True),
-        ("is_next_fiscal_quarter", dt.datetime(2025, 4, 1, 0, 0), True),
-        ("is_this_fiscal_year", dt.datetime(2025, 5, 1, 0, 0), True),
-        ("is_last_fiscal_year", dt.datetime(2024, 6, 1, 0, 0), True),
-        ("is_next_fiscal_year", dt.datetime(2026, 3, 1, 0, 0), True),
-    ],
-)
-def test_biz_shortcuts_golden(shortcut: str, target_dt: dt.datetime, expected: bool) -> None:
+    # day shortcuts
+    yield ("is_today", True, ("cal", dt.datetime(2025, 1, 13, 0, 0)))
+    yield ("is_today", False, ("cal", dt.datetime(2025, 1, 11, 12, 0)))
+    yield ("is_yesterday", True, ("cal", dt.datetime(2025, 1, 12, 9, 0)))
+    yield ("is_tomorrow", True, ("cal", dt.datetime(2025, 1, 14, 9, 0)))
+    # week shortcuts (ref week = 2025-01-13..2025-01-19)
+    yield ("is_last_week", True, ("cal", dt.datetime(2025, 1, 6, 0, 0)))    # previous week
+    yield ("is_this_week", True, ("cal", dt.datetime(2025, 1, 15, 0, 0)))   # same week
+    yield ("is_next_week", True, ("cal", dt.datetime(2025, 1, 20, 0, 0)))   # next week
+    # month shortcuts (ref month = Jan 2025)
+    yield ("is_last_month", True, ("cal", dt.datetime(2024, 12, 15, 0, 0)))
+    yield ("is_this_month", True, ("cal", dt.datetime(2025, 1, 5, 0, 0)))
+    yield ("is_next_month", True, ("cal", dt.datetime(2025, 2, 10, 0, 0)))
+    # quarter shortcuts (Q1=Jan-Mar for calendar quarters)
+    yield ("is_last_quarter", True, ("cal", dt.datetime(2024, 11, 15, 0, 0)))  # Q4 2024
+    yield ("is_this_quarter", True, ("cal", dt.datetime(2025, 2, 1, 0, 0)))    # Q1 2025
+    yield ("is_next_quarter", True, ("cal", dt.datetime(2025, 4, 1, 0, 0)))    # Q2 2025
+    # year shortcuts
+    yield ("is_last_year", True, ("cal", dt.datetime(2024, 6, 1, 0, 0)))
+    yield ("is_this_year", True, ("cal", dt.datetime(2025, 7, 1, 0, 0)))
+    yield ("is_next_year", True, ("cal", dt.datetime(2026, 3, 1, 0, 0)))
+    # obvious negatives for some units (sanity)
+    yield ("is_last_month", False, ("cal", dt.datetime(2025, 1, 2, 0, 0)))
+    yield ("is_this_week", False, ("cal", dt.datetime(2025, 1, 6, 0, 0)))
+    # business-day / workday shortcuts (today/yesterday/tomorrow)
+    yield ("is_business_day_today", True, ("biz", dt.datetime(2025, 1, 13, 10, 0)))
+    yield ("is_business_day_yesterday", True, ("biz", dt.datetime(2025, 1, 10, 10, 0)))
+    yield ("is_business_day_tomorrow", True, ("biz", dt.datetime(2025, 1, 14, 10, 0)))
+    yield ("is_workday_today", True, ("biz", dt.datetime(2025, 1, 13, 10, 0)))
+    yield ("is_workday_yesterday", True, ("biz", dt.datetime(2025, 1, 10, 10, 0)))
+    yield ("is_workday_tomorrow", True, ("biz", dt.datetime(2025, 1, 14, 10, 0)))
+    # fiscal shortcuts (calendar fiscal year starting Jan)
+    yield ("is_this_fiscal_quarter", True, ("biz", dt.datetime(2025, 2, 1, 0, 0)))
+    yield ("is_last_fiscal_quarter", True, ("biz", dt.datetime(2024, 11, 15, 0, 0)))
+    yield ("is_next_fiscal_quarter", True, ("biz", dt.datetime(2025, 4, 1, 0, 0)))
+    yield ("is_this_fiscal_year", True, ("biz", dt.datetime(2025, 5, 1, 0, 0)))
+    yield ("is_last_fiscal_year", True, ("biz", dt.datetime(2024, 6, 1, 0, 0)))
+    yield ("is_next_fiscal_year", True, ("biz", dt.datetime(2026, 3, 1, 0, 0)))
+
+
+# Shortcut-name -> attrgetter table, filled when the golden cases are
+# materialized; rows then dispatch through a C-level attribute fetch instead
+# of a getattr name lookup per case.
+_GETTERS: dict[str, Callable[[Cal | Biz], bool]] = {}
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize the golden-shortcut test from the lazy case generator."""
+    if "shortcut" in metafunc.fixturenames:
+        # pytest requires a Collection here, so materialize the generator
+        # at parametrization time (still after module import).
+        cases = list(_golden_cases())
+        _GETTERS.update({s: attrgetter(s) for s, _, _ in cases})
+        metafunc.parametrize(
+            "shortcut, expected, instance", cases, indirect=["instance"]
+        )
+
+
+def test_shortcuts_golden(shortcut: str, expected: bool, instance: Cal | Biz) -> None:
     """
-    Test Biz shortcuts with explicit golden datetimes. Uses default BizPolicy.
+    Test Cal and Biz shortcuts with explicit golden datetimes (no parity
+    comparisons). The indirect `instance` fixture builds the right object
+    for each row; Biz rows use the default BizPolicy.
     """
-    policy = BizPolicy()  # default policy; golden dates chosen to be unambiguous
-    b = Biz(target_dt=target_dt, ref_dt=REF, policy=policy)
-    assert getattr(b, shortcut) is expected
+    assert _GETTERS[shortcut](instance) is expected
 
 
-def test_unit_call_and_thru() -> None:
+def test_unit_call_and_thru(cal_ref: Cal, biz_ref: Biz) -> None:
     """Exercise Unit call/between/thru/alias behaviors with golden expectations.
 
     This avoids parity checks while still exercising the Unit implementation
-    paths (call, between alias, and thru property).
+    paths (call, between alias, and thru property). Uses the session-scoped
+    `cal_ref`/`biz_ref` fixtures rather than rebuilding Cal/Biz locally.
     """
-    cal = Cal(target_dt=REF, ref_dt=REF)
-    day_ns = cal.day
+    day_ns = cal_ref.day
 
     # in_(0) should be True for ref==target
     assert day_ns.in_(0) is True
@@ -95,34 +132,47 @@ def test_unit_call_and_thru() -> None:
     assert day_ns.thru(-1, 0) is True
 
     # Also exercise a Biz Unit (work_day)
-    policy = BizPolicy()
-    b = Biz(target_dt=REF, ref_dt=REF, policy=policy)
-    w_ns = b.work_day
+    w_ns = biz_ref.work_day
     assert w_ns.in_(0) is True
     assert w_ns.between(0) is True
     assert w_ns.thru(0) is True
 
-@pytest.mark.parametrize("inclusive, expected", [
-    # For offset -2, -1, 0, 1, 2 with window (-1, 1)
-    # "both": [-1, 0, 1] are inside
-    ("both", [False, True, True, True, False]),
-    # "left": [-1, 0] are inside
-    ("left", [False, True, True, False, False]),
-    # "right": [0, 1] are inside
-    ("right", [False, False, True, True, False]),
-    # "neither": [0] is inside
-    ("neither", [False, False, True, False, False]),
-])
-def test_between_edges_and_inside(inclusive: str, expected: list[bool]) -> None:
+def test_cal_batch_matches_per_row_construction() -> None:
+    """Cal.batch evaluates the cal golden rows identically to per-row Cals."""
+    rows = [(s, e, t) for s, e, (kind, t) in _golden_cases() if kind == "cal"]
+    cals = Cal.batch([t for _, _, t in rows], REF)
+    actual = [getattr(c, shortcut) for c, (shortcut, _, _) in zip(cals, rows)]
+    assert actual == [expected for _, expected, _ in rows]
+
+
+def test_biz_batch_matches_per_row_construction() -> None:
+    """Biz.batch evaluates the biz golden rows identically to per-row Bizs."""
+    rows = [(s, e, t) for s, e, (kind, t) in _golden_cases() if kind == "biz"]
+    bizs = Biz.batch([t for _, _, t in rows], REF, policy=_DEFAULT_POLICY)
+    actual = [getattr(b, shortcut) for b, (shortcut, _, _) in zip(bizs, rows)]
+    assert actual == [expected for _, expected, _ in rows]
+    # All instances share the one policy (no per-target policy construction).
+    assert all(b.cal_policy is _DEFAULT_POLICY for b in bizs)
+
+
+# Expected between(-1, 1, inclusive=...) results per offset -2..2.
+EXPECTED = {
+    "both": [False, True, True, True, False],       # [-1, 0, 1] are inside
+    "left": [False, True, True, False, False],      # [-1, 0] are inside
+    "right": [False, False, True, True, False],     # [0, 1] are inside
+    "neither": [False, False, True, False, False],  # [0] is inside
+}
+
+
+@pytest.mark.parametrize("offset", [-2, -1, 0, 1, 2])
+@pytest.mark.parametrize("inclusive", list(EXPECTED))
+def test_between_edges_and_inside(inclusive: str, offset: int) -> None:
     """
     Test Cal.day.between for all inclusivity options, with offsets:
     outside_low (-2), edge (-1), inside (0), edge (1), outside_high (2)
-    Window is (-1, 1)
+    Window is (-1, 1). Each (inclusive, offset) pair is its own case.
     """
-    ref_dt = dt.datetime(2025, 1, 13, 12, 0)
-    results: list[bool] = []
-    for offset in [-2, -1, 0, 1, 2]:
-        target = ref_dt + dt.timedelta(days=offset)
-        c = Cal(target_dt=target, ref_dt=ref_dt)
-        results.append(c.day.between(-1, 1, inclusive=inclusive))
-    assert results == expected
\ No newline at end of file
+    target = REF + dt.timedelta(days=offset)
+    c = Cal(target_dt=target, ref_dt=REF)
+    expected_at_offset = EXPECTED[inclusive][offset + 2]
+    assert c.day.between(-1, 1, inclusive=inclusive) is expected_at_offset
\ No newline at end of file
@@ -12,6 +12,11 @@ from pytest import approx
 from frist._biz_policy import BizPolicy
 from frist._frist import Age, Cal, Chrono
 
+# Shared holiday sets, frozen once at import; BizPolicy accepts frozensets
+# directly so no per-test set rebuild happens.
+_HOLIDAYS_2024 = frozenset({"2024-01-01", "2024-12-25"})
+_EMPTY_HOLIDAYS: frozenset[str] = frozenset()
+
 
 def test_chrono_creation():
     """Test basic Chrono object creation."""
@@ -140,6 +145,40 @@ def test_chrono_parse_errors():
         Chrono.parse("not-a-date-at-all")
 
 
+@pytest.mark.parametrize("near_iso", [
+    "2024-01-15T14:30",            # T separator requires seconds
+    "2024-01-15Z",                 # Z only valid after T...:SS
+    "2024-01-15 14:30Z",           # Z not valid with the space separator
+    "2024-01-15 14:30:45Z",        # Z not valid with the space separator
+    "2024-01-15 14:30:45.123456",  # fractional seconds unsupported
+])
+def test_chrono_parse_rejects_near_iso_shapes(near_iso: str):
+    """Test that near-ISO shapes outside the supported format list still raise.
+
+    These parse under datetime.fromisoformat, so the fast-path gate must
+    exclude them to keep the accepted grammar identical to the format list.
+    """
+    with pytest.raises(ValueError, match="Unable to parse time string"):
+        Chrono.parse(near_iso)
+
+
+@pytest.mark.parametrize("lenient, expected", [
+    ("2024-1-1", dt.datetime(2024, 1, 1)),
+    ("2024-12-25 4:30", dt.datetime(2024, 12, 25, 4, 30)),
+    ("2024-1-1T4:3:2", dt.datetime(2024, 1, 1, 4, 3, 2)),
+])
+def test_chrono_parse_accepts_unpadded_iso_forms(lenient: str, expected: dt.datetime):
+    """Test that unpadded ISO-style spellings still parse via strptime.
+
+    These fail the zero-padded fast-path gate, so they exercise the fallback
+    format list; strptime tolerates missing zero padding and always has.
+    """
+    # Act
+    chrono = Chrono.parse(lenient)
+    # Assert
+    assert chrono.target_dt == expected, f"parse({lenient!r}) should be {expected}"
+
+
 def test_chrono_fiscal_properties():
     """Test fiscal year and quarter properties."""
     # Default fiscal year (starts in January)
@@ -162,7 +201,7 @@ def test_chrono_fiscal_properties():
 
 def test_chrono_holiday_property():
     """Test holiday detection property."""
-    policy: BizPolicy = BizPolicy(holidays={"2024-01-01", "2024-12-25"})
+    policy: BizPolicy = BizPolicy(holidays=_HOLIDAYS_2024)
 
     target_dt: dt.datetime = dt.datetime(2024, 1, 1)
     chrono: Chrono = Chrono(target_dt=target_dt, policy=policy)
@@ -173,7 +212,7 @@ def test_chrono_holiday_property():
     assert chrono_not.biz.holiday is False
 
     # Empty holidays
-    empty_policy: BizPolicy = BizPolicy(holidays=set())
+    empty_policy: BizPolicy = BizPolicy(holidays=_EMPTY_HOLIDAYS)
     chrono_empty: Chrono = Chrono(target_dt=target_dt, policy=empty_policy)
     assert chrono_empty.biz.holiday is False
 
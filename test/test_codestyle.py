@@ -0,0 +1,27 @@
+"""
+Enforce project code-style policies that lint tools do not cover.
+
+Currently guards the "no JIT compilation of datetime helpers" rule from
+CODESTYLE.md: the string/datetime-heavy core must rely on pure-CPython fast
+paths, not Numba-style compilers.
+"""
+
+import pathlib
+import re
+
+_SRC_DIR = pathlib.Path(__file__).parent.parent / "src" / "frist"
+
+# Any import or decorator use of a JIT compiler in the core package.
+_JIT_RE = re.compile(r"\bnumba\b|@n?jit\b")
+
+
+def test_no_jit_decorators_in_core():
+    """Test that no frist module imports or applies Numba-style JIT compilation."""
+    # Arrange
+    offenders: list[str] = []
+    # Act
+    for path in sorted(_SRC_DIR.rglob("*.py")):
+        if _JIT_RE.search(path.read_text()):
+            offenders.append(path.name)
+    # Assert
+    assert not offenders, f"JIT compilation is disallowed in frist (see CODESTYLE.md): {offenders}"
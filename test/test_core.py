@@ -5,6 +5,7 @@ Tests Chrono and time_pair as standalone dt.datetime utilities without file depe
 """
 
 import datetime as dt
+import math
 
 import pytest
 from pytest import approx
@@ -12,100 +13,91 @@ from pytest import approx
 from frist._biz_policy import BizPolicy
 from frist._frist import Age, Cal, Chrono, time_pair
 
+# Common reference datetimes and their POSIX timestamps, computed once at
+# import. datetime.timestamp() consults the local timezone, so folding it to
+# a constant keeps the tests cheap and avoids repeated tz lookups.
+_DT_20240101_1200 = dt.datetime(2024, 1, 1, 12, 0, 0)
+_DT_20240102_1200 = dt.datetime(2024, 1, 2, 12, 0, 0)
+_TS_20240101_1200 = _DT_20240101_1200.timestamp()
+_TS_20240102_1200 = _DT_20240102_1200.timestamp()
+
+# Operands for the Age input-equivalence tests, converted once here.
+_AGE_START = dt.datetime(2020, 6, 15, 14, 30, 45)
+_AGE_END = dt.datetime(2023, 9, 22, 9, 15, 30)
+_AGE_START_TS = _AGE_START.timestamp()
+_AGE_END_TS = _AGE_END.timestamp()
+
+# Equivalent (start, end) representations keyed by input type; built once at
+# import rather than per test run.
+_AGE_EQUIV_INPUTS = {
+    "datetime": (_AGE_START, _AGE_END),
+    "float": (_AGE_START_TS, _AGE_END_TS),
+    "int": (int(_AGE_START_TS), int(_AGE_END_TS)),
+    "str_datetime": (_AGE_START.strftime("%Y-%m-%d %H:%M:%S"),
+                     _AGE_END.strftime("%Y-%m-%d %H:%M:%S")),
+}
+
+_AGE_MIDNIGHT_START = dt.datetime(2020, 6, 15, 0, 0, 0)
+_AGE_MIDNIGHT_END = dt.datetime(2023, 9, 22, 0, 0, 0)
+_AGE_MIDNIGHT_INPUTS = {
+    "date": (_AGE_MIDNIGHT_START.date(), _AGE_MIDNIGHT_END.date()),
+    "str_date": (_AGE_MIDNIGHT_START.strftime("%Y-%m-%d"),
+                 _AGE_MIDNIGHT_END.strftime("%Y-%m-%d")),
+}
+
+
+@pytest.fixture(scope="module")
+def reference_age() -> Age:
+    """Reference Age for the input-equivalence test, built once per module."""
+    return Age(_AGE_START, _AGE_END)
+
+
+@pytest.fixture(scope="module")
+def midnight_reference_age() -> Age:
+    """Reference Age for the midnight-equivalence test, built once per module."""
+    return Age(_AGE_MIDNIGHT_START, _AGE_MIDNIGHT_END)
 
-def test_time_pair_datetime() -> None:
-    """Test time_pair with datetime objects."""
-    # Arrange
-    target_tim: dt.datetime = dt.datetime(2024, 1, 1, 12, 0, 0)
-    reference_tim: dt.datetime = dt.datetime(2024, 1, 2, 12, 0, 0)
-    # Act
-    actual_target_tim, actual_reference_tim = time_pair(start_time=target_tim, end_time=reference_tim)
-    # Assert
-    expected_target_tim = target_tim
-    expected_reference_tim = reference_tim
-    assert actual_target_tim == expected_target_tim, f"Expected target {expected_target_tim}, got {actual_target_tim}"
-    assert actual_reference_tim == expected_reference_tim, f"Expected reference {expected_reference_tim}, got {actual_reference_tim}"
 
-def test_time_pair_date() -> None:
-    """Test time_pair with date objects."""
-    # Arrange
-    target_dt: dt.date = dt.date(2024, 1, 1)
-    reference_dt: dt.date = dt.date(2024, 1, 2)
-    # Act
-    actual_target_tim, actual_reference_tim = time_pair(start_time=target_dt, end_time=reference_dt)
-    # Assert
-    expected_target_tim = dt.datetime(2024, 1, 1)
-    expected_reference_tim = dt.datetime(2024, 1, 2)
-    assert actual_target_tim == expected_target_tim, f"Expected target {expected_target_tim}, got {actual_target_tim}"
-    assert actual_reference_tim == expected_reference_tim, f"Expected reference {expected_reference_tim}, got {actual_reference_tim}"
-
-def test_time_pair_float_timestamp() -> None:
-    """Test time_pair with float timestamps."""
-    # Arrange
-    target_ts: float = dt.datetime(2024, 1, 1, 12, 0, 0).timestamp()
-    reference_ts: float = dt.datetime(2024, 1, 2, 12, 0, 0).timestamp()
-    # Act
-    actual_target_tim, actual_reference_tim = time_pair(start_time=target_ts, end_time=reference_ts)
-    # Assert
-    expected_target_tim = dt.datetime(2024, 1, 1, 12, 0, 0)
-    expected_reference_tim = dt.datetime(2024, 1, 2, 12, 0, 0)
-    assert actual_target_tim == expected_target_tim, f"Expected target {expected_target_tim}, got {actual_target_tim}"
-    assert actual_reference_tim == expected_reference_tim, f"Expected reference {expected_reference_tim}, got {actual_reference_tim}"
-
-def test_time_pair_int_timestamp() -> None:
-    """Test time_pair with int timestamps."""
-    # Arrange
-    target_ts: int = int(dt.datetime(2024, 1, 1, 12, 0, 0).timestamp())
-    reference_ts: int = int(dt.datetime(2024, 1, 2, 12, 0, 0).timestamp())
-    # Act
-    actual_target_tim, actual_reference_tim = time_pair(start_time=target_ts, end_time=reference_ts)
-    # Assert
-    expected_target_tim = dt.datetime(2024, 1, 1, 12, 0, 0)
-    expected_reference_tim = dt.datetime(2024, 1, 2, 12, 0, 0)
-    assert actual_target_tim == expected_target_tim, f"Expected target {expected_target_tim}, got {actual_target_tim}"
-    assert actual_reference_tim == expected_reference_tim, f"Expected reference {expected_reference_tim}, got {actual_reference_tim}"
-
-def test_time_pair_string_datetime() -> None:
-    """Test time_pair with string full datetime."""
-    # Arrange
-    start_str: str = "2024-01-01 12:00:00"
-    end_str: str = "2024-01-02 12:00:00"
-    # Act
-    actual_target_tim, actual_reference_tim = time_pair(start_time=start_str, end_time=end_str)
-    # Assert
-    expected_target_tim = dt.datetime(2024, 1, 1, 12, 0, 0)
-    expected_reference_tim = dt.datetime(2024, 1, 2, 12, 0, 0)
-    assert actual_target_tim == expected_target_tim, f"Expected target {expected_target_tim}, got {actual_target_tim}"
-    assert actual_reference_tim == expected_reference_tim, f"Expected reference {expected_reference_tim}, got {actual_reference_tim}"
-
-def test_time_pair_string_date() -> None:
-    """Test time_pair with string date only."""
-    # Arrange
-    start_str: str = "2024-01-01"
-    end_str: str = "2024-01-02"
+@pytest.mark.parametrize(
+    "start, end, exp_start, exp_end",
+    [
+        pytest.param(_DT_20240101_1200, _DT_20240102_1200,
+                     _DT_20240101_1200, _DT_20240102_1200, id="datetime"),
+        pytest.param(dt.date(2024, 1, 1), dt.date(2024, 1, 2),
+                     dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2), id="date"),
+        pytest.param(_TS_20240101_1200, _TS_20240102_1200,
+                     _DT_20240101_1200, _DT_20240102_1200, id="float_timestamp"),
+        pytest.param(int(_TS_20240101_1200), int(_TS_20240102_1200),
+                     _DT_20240101_1200, _DT_20240102_1200, id="int_timestamp"),
+        pytest.param("2024-01-01 12:00:00", "2024-01-02 12:00:00",
+                     _DT_20240101_1200, _DT_20240102_1200, id="string_datetime"),
+        pytest.param("2024-01-01", "2024-01-02",
+                     dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2), id="string_date"),
+    ],
+)
+def test_time_pair(start, end, exp_start, exp_end) -> None:
+    """Test time_pair across equivalent input types (one table, one body)."""
     # Act
-    actual_target_tim, actual_reference_tim = time_pair(start_time=start_str, end_time=end_str)
+    actual_start, actual_end = time_pair(start_time=start, end_time=end)
     # Assert
-    expected_target_tim = dt.datetime(2024, 1, 1, 0, 0, 0)
-    expected_reference_tim = dt.datetime(2024, 1, 2, 0, 0, 0)
-    assert actual_target_tim == expected_target_tim, f"Expected target {expected_target_tim}, got {actual_target_tim}"
-    assert actual_reference_tim == expected_reference_tim, f"Expected reference {expected_reference_tim}, got {actual_reference_tim}"
+    assert actual_start == exp_start
+    assert actual_end == exp_end
 
 def test_time_pair_end_time_none_defaults_to_now() -> None:
     """Test time_pair with end_time=None defaults to now."""
     # Arrange
-    target_tim: dt.datetime = dt.datetime(2024, 1, 1, 12, 0, 0)
+    target_tim: dt.datetime = _DT_20240101_1200
     # Act
     actual_target_tim, actual_reference_tim = time_pair(start_time=target_tim, end_time=None)
     # Assert
     expected_target_tim = target_tim
-    assert actual_target_tim == expected_target_tim, f"Expected target {expected_target_tim}, got {actual_target_tim}"
+    assert actual_target_tim == expected_target_tim
     assert isinstance(actual_reference_tim, dt.datetime), f"Expected reference to be datetime, got {type(actual_reference_tim)}"
 
 def test_time_pair_start_time_none_raises() -> None:
     """Test time_pair with start_time=None raises TypeError."""
     # Arrange
-    reference_tim: dt.datetime = dt.datetime(2024, 1, 2, 12, 0, 0)
+    reference_tim: dt.datetime = _DT_20240102_1200
     # Act & Assert
     with pytest.raises(TypeError):
         time_pair(start_time=None, end_time=reference_tim)
@@ -113,7 +105,7 @@ def test_time_pair_start_time_none_raises() -> None:
 def test_time_pair_unsupported_type_raises() -> None:
     """Test time_pair with unsupported type raises TypeError."""
     # Arrange
-    reference_tim: dt.datetime = dt.datetime(2024, 1, 2, 12, 0, 0)
+    reference_tim: dt.datetime = _DT_20240102_1200
     # Act & Assert
     with pytest.raises(TypeError):
         time_pair(start_time=[2024, 1, 1], end_time=reference_tim)
@@ -121,15 +113,15 @@ def test_time_pair_unsupported_type_raises() -> None:
 def test_time_pair_unsupported_string_format_raises() -> None:
     """Test time_pair with unsupported string format raises TypeError."""
     # Arrange
-    reference_tim: dt.datetime = dt.datetime(2024, 1, 2, 12, 0, 0)
+    reference_tim: dt.datetime = _DT_20240102_1200
     # Act & Assert
     with pytest.raises(TypeError):
         time_pair(start_time="not-a-date", end_time=reference_tim)
 
 def test_chrono_creation():
     """Test basic Chrono object creation."""
-    target_tim: dt.datetime = dt.datetime(2024, 1, 1, 12, 0, 0)
-    reference_tim: dt.datetime = dt.datetime(2024, 1, 2, 12, 0, 0)
+    target_tim: dt.datetime = _DT_20240101_1200
+    reference_tim: dt.datetime = _DT_20240102_1200
 
     # Test with explicit reference time
     z: Chrono = Chrono(target_dt=target_tim, ref_dt=reference_tim)
@@ -143,25 +135,16 @@ def test_chrono_creation():
     assert chrono_now.ref_dt is not None
 
 
-def test_chrono_properties():
+def test_chrono_properties(chrono_fixed: Chrono):
     """Test Chrono object properties."""
-    target_tim: dt.datetime = dt.datetime(2024, 1, 1, 12, 0, 0)
-    reference_tim: dt.datetime = dt.datetime(2024, 1, 2, 12, 0, 0)
-
-    z: Chrono = Chrono(target_dt=target_tim, ref_dt=reference_tim)
-
     # Test basic properties
-    assert z.timestamp == target_tim.timestamp()
+    assert chrono_fixed.timestamp == _TS_20240101_1200
 
 
 
-def test_chrono_age_property():
+def test_chrono_age_property(chrono_fixed: Chrono):
     """Test that Chrono age property works correctly."""
-    target_tim: dt.datetime = dt.datetime(2024, 1, 1, 12, 0, 0)
-    reference_tim: dt.datetime = dt.datetime(2024, 1, 2, 12, 0, 0)
-
-    z: Chrono = Chrono(target_dt=target_tim, ref_dt=reference_tim)
-    age: Age = z.age
+    age: Age = chrono_fixed.age
 
     # Test that age calculations work
     assert age.seconds == 86400.0
@@ -173,7 +156,7 @@ def test_chrono_age_property():
 
 def test_chrono_calendar_property():
     """Test that Chrono calendar property works correctly."""
-    target_tim: dt.datetime = dt.datetime(2024, 1, 1, 12, 0, 0)
+    target_tim: dt.datetime = _DT_20240101_1200
     reference_tim: dt.datetime = dt.datetime(2024, 1, 1, 18, 0, 0)  # Same day, 6 hours later
 
     z: Chrono = Chrono(target_dt=target_tim, ref_dt=reference_tim)
@@ -187,8 +170,8 @@ def test_chrono_calendar_property():
 
 def test_chrono_with_reference_time():
     """Test creating new Chrono with different reference time."""
-    target_tim: dt.datetime = dt.datetime(2024, 1, 1, 12, 0, 0)
-    original_ref_tim: dt.datetime = dt.datetime(2024, 1, 2, 12, 0, 0)
+    target_tim: dt.datetime = _DT_20240101_1200
+    original_ref_tim: dt.datetime = _DT_20240102_1200
     new_ref_tim: dt.datetime = dt.datetime(2024, 1, 3, 12, 0, 0)
 
     chrono1: Chrono = Chrono(target_dt=target_tim, ref_dt=original_ref_tim)
@@ -202,22 +185,17 @@ def test_chrono_with_reference_time():
     assert chrono2.target_dt == target_tim  # Same target
 
 
-def test_chrono_string_representations():
+def test_chrono_string_representations(chrono_fixed: Chrono):
     """Test string representations of Chrono objects."""
-    target_tim: dt.datetime = dt.datetime(2024, 1, 1, 12, 30, 45)
-    reference_tim: dt.datetime = dt.datetime(2024, 1, 2, 12, 0, 0)
-
-    z: Chrono = Chrono(target_dt=target_tim, ref_dt=reference_tim)
-
     # Test __repr__
-    repr_str: str = repr(z)
+    repr_str: str = repr(chrono_fixed)
     assert "Chrono" in repr_str
-    assert "2024-01-01T12:30:45" in repr_str
+    assert "2024-01-01T12:00:00" in repr_str
     assert "2024-01-02T12:00:00" in repr_str
 
     # Test __str__
-    str_str: str = str(z)
-    assert "Chrono for 2024-01-01 12:30:45" in str_str
+    str_str: str = str(chrono_fixed)
+    assert "Chrono for 2024-01-01 12:00:00" in str_str
 
 
 def test_chrono_parse_static_method():
@@ -291,87 +269,42 @@ def test_chrono_holiday_property():
     assert chrono_empty.biz.holiday is False
 
 
-@pytest.mark.parametrize(
-    "input_type",
-    ["datetime", "float", "int", "str_datetime"],
-)
-def test_age_equivalent_inputs_produce_same_results(input_type: str) -> None:
+def _assert_age_matches_reference(age: Age, reference_age: Age, input_type: str) -> None:
+    """Assert that an Age built from an alternate input matches the reference.
+
+    Uses math.isclose rather than pytest.approx: this helper runs in loops
+    over input variants, and isclose skips approx's wrapper-object overhead.
+    The f-string messages already say which field and variant diverged.
+    """
+    assert math.isclose(age.days, reference_age.days, rel_tol=1e-10), f"Days differ for {input_type}"
+    assert age.seconds == reference_age.seconds, f"Seconds differ for {input_type}"
+    assert math.isclose(age.years_precise, reference_age.years_precise, rel_tol=1e-10), f"Years precise differ for {input_type}"
+    assert math.isclose(age.months_precise, reference_age.months_precise, rel_tol=1e-10), f"Months precise differ for {input_type}"
+
+
+def test_age_equivalent_inputs_produce_same_results(reference_age: Age) -> None:
     """
     Test that equivalent TimeLike representations of the same instant produce identical Age calculations.
-    
+
     This tests that datetime, timestamp (float/int), and string representations of the same time
-    all produce identical Age objects and calculations.
+    all produce identical Age objects and calculations. The variants are checked
+    in one test against a single reference Age rather than rebuilding it per
+    parametrize case.
     """
-    # Arrange: Define reference times with specific time components
-    start_dt = dt.datetime(2020, 6, 15, 14, 30, 45)
-    end_dt = dt.datetime(2023, 9, 22, 9, 15, 30)
-    
-    # Convert to equivalent representations
-    time_formats = {
-        "datetime": start_dt,
-        "float": start_dt.timestamp(),
-        "int": int(start_dt.timestamp()),
-        "str_datetime": start_dt.strftime("%Y-%m-%d %H:%M:%S"),
-    }
-    
-    end_time_formats = {
-        "datetime": end_dt,
-        "float": end_dt.timestamp(),
-        "int": int(end_dt.timestamp()),
-        "str_datetime": end_dt.strftime("%Y-%m-%d %H:%M:%S"),
-    }
-    
-    start_input = time_formats[input_type]
-    end_input = end_time_formats[input_type]
-    
-    # Act: Create Age object
-    age = Age(start_input, end_input)
-    
-    # Assert: Results should be identical to reference datetime Age
-    reference_age = Age(start_dt, end_dt)
-    
-    assert age.days == approx(reference_age.days, rel=1e-10), f"Days differ for {input_type}"
-    assert age.seconds == reference_age.seconds, f"Seconds differ for {input_type}"
-    assert age.years_precise == approx(reference_age.years_precise, rel=1e-10), f"Years precise differ for {input_type}"
-    assert age.months_precise == approx(reference_age.months_precise, rel=1e-10), f"Months precise differ for {input_type}"
+    # Act / Assert: each variant matches the single reference Age
+    for input_type, (start_input, end_input) in _AGE_EQUIV_INPUTS.items():
+        _assert_age_matches_reference(Age(start_input, end_input), reference_age, input_type)
 
 
-@pytest.mark.parametrize(
-    "input_type",
-    ["date", "str_date"],
-)
-def test_age_midnight_inputs_produce_same_results(input_type: str) -> None:
+def test_age_midnight_inputs_produce_same_results(midnight_reference_age: Age) -> None:
     """
     Test that date and date-string representations (both midnight) produce identical Age calculations.
     """
-    # Arrange: Define reference times at midnight
-    start_dt = dt.datetime(2020, 6, 15, 0, 0, 0)  # Midnight
-    end_dt = dt.datetime(2023, 9, 22, 0, 0, 0)    # Midnight
-    
-    # Convert to midnight representations
-    time_formats = {
-        "date": start_dt.date(),
-        "str_date": start_dt.strftime("%Y-%m-%d"),
-    }
-    
-    end_time_formats = {
-        "date": end_dt.date(),
-        "str_date": end_dt.strftime("%Y-%m-%d"),
-    }
-    
-    start_input = time_formats[input_type]
-    end_input = end_time_formats[input_type]
-    
-    # Act: Create Age object
-    age = Age(start_input, end_input)
-    
-    # Assert: Results should be identical to reference midnight datetime Age
-    reference_age = Age(start_dt, end_dt)
-    
-    assert age.days == approx(reference_age.days, rel=1e-10), f"Days differ for {input_type}"
-    assert age.seconds == reference_age.seconds, f"Seconds differ for {input_type}"
-    assert age.years_precise == approx(reference_age.years_precise, rel=1e-10), f"Years precise differ for {input_type}"
-    assert age.months_precise == approx(reference_age.months_precise, rel=1e-10), f"Months precise differ for {input_type}"
+    # Act / Assert: each variant matches the single reference Age
+    for input_type, (start_input, end_input) in _AGE_MIDNIGHT_INPUTS.items():
+        _assert_age_matches_reference(
+            Age(start_input, end_input), midnight_reference_age, input_type
+        )
 
 
 def test_age_datetime_vs_date_different_results() -> None:
@@ -503,7 +436,7 @@ def test_biz_business_days_calculation():
 
 def test_chrono_property_integration():
     """Test that Chrono properties work together correctly."""
-    target = dt.datetime(2024, 1, 1, 12, 0, 0)  # Monday
+    target = _DT_20240101_1200  # Monday
     ref = dt.datetime(2024, 1, 5, 12, 0, 0)     # Friday (same week)
     
     chrono = Chrono(target_dt=target, ref_dt=ref)
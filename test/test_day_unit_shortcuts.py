@@ -2,22 +2,26 @@ import datetime as dt
 
 from frist import Cal
 
+# Shared reference datetimes, built once at import.
+_REF_NOON = dt.datetime(2025, 12, 5, 12, 0)
+_REF_MIDNIGHT = dt.datetime(2025, 12, 5, 0, 0)
+
 
 def test_day_unit_shortcuts_today_yesterday_tomorrow():
-    ref = dt.datetime(2025, 12, 5, 12, 0)
-    # today
-    assert Cal(dt.datetime(2025, 12, 5, 9, 0), ref).day.is_today is True
-    # yesterday
-    assert Cal(dt.datetime(2025, 12, 4, 9, 0), ref).day.is_yesterday is True
-    # tomorrow
-    assert Cal(dt.datetime(2025, 12, 6, 9, 0), ref).day.is_tomorrow is True
+    # One Cal per target day, each checked against its matching shortcut.
+    cases = [
+        (dt.datetime(2025, 12, 5, 9, 0), "is_today"),
+        (dt.datetime(2025, 12, 4, 9, 0), "is_yesterday"),
+        (dt.datetime(2025, 12, 6, 9, 0), "is_tomorrow"),
+    ]
+    for target, shortcut in cases:
+        assert getattr(Cal(target, _REF_NOON).day, shortcut) is True, shortcut
 
 
 def test_day_unit_in_impl_half_open_boundaries():
-    ref = dt.datetime(2025, 12, 5, 0, 0)
-    cal = Cal(dt.datetime(2025, 12, 5, 23, 59, 59), ref)
+    cal = Cal(dt.datetime(2025, 12, 5, 23, 59, 59), _REF_MIDNIGHT)
     # window [-1, 1) covers yesterday and today (exclusive end at tomorrow)
     assert cal.day.in_(-1, 1) is True
     # end exclusive: a time exactly at start of tomorrow is not included
-    cal2 = Cal(dt.datetime(2025, 12, 6, 0, 0), ref)
+    cal2 = Cal(dt.datetime(2025, 12, 6, 0, 0), _REF_MIDNIGHT)
     assert cal2.day.in_(-1, 1) is False
@@ -4,6 +4,7 @@ Covers core methods and edge cases for direct usage.
 """
 
 import datetime as dt
+import functools
 
 import pytest
 
@@ -11,13 +12,30 @@ from frist import Cal
 from frist.units import MonthUnit
 
 
+@functools.lru_cache(maxsize=None)
+def _make_month_unit(target: dt.datetime, ref: dt.datetime) -> MonthUnit:
+    """Cached MonthUnit factory: parametrize rows reuse the same date pairs,
+    so identical (target, ref) pairs share one Cal/MonthUnit construction."""
+    return MonthUnit(Cal(target, ref))
+
+
+# Python weekday number for Friday; int specs skip normalize_weekday's
+# string lowering and dict lookup, so a few rows below exercise that path.
+_FRIDAY = 4
+
+
+# Shared mid-March unit: both non-parametrized and _month_index tests read it,
+# so it is built once at import instead of once per test.
+_REF_2024_3_15 = dt.datetime(2024, 3, 15)
+_MN_2024_3_15 = _make_month_unit(_REF_2024_3_15, _REF_2024_3_15)
+
+
 def test_month_unit_in_impl_basic():
     """
     Test _in_impl for current, previous, and next month.
     """
     # Arrange
-    cal = Cal(dt.datetime(2024, 3, 15), dt.datetime(2024, 3, 15))
-    mn: MonthUnit = MonthUnit(cal)
+    mn: MonthUnit = _MN_2024_3_15
     # Act & Assert
     assert mn.in_(0, 1), "Should be in current month (0 offset)"
     assert not mn.in_(-1, 0), "Should not be in previous month"
@@ -36,8 +54,7 @@ def test_month_unit_month_index(dt_value:dt.datetime, expected:int, msg:str):
     Parametrized test for _month_index, including assert message.
     """
     # Arrange
-    cal = Cal(dt.datetime(2024, 3, 15), dt.datetime(2024, 3, 15))
-    mn = MonthUnit(cal)
+    mn = _MN_2024_3_15
     # Act & Assert
     assert mn._month_index(dt_value) == expected, msg
 
@@ -45,19 +62,19 @@ def test_month_unit_month_index(dt_value:dt.datetime, expected:int, msg:str):
 @pytest.mark.parametrize(
     "ref_date, weekday, n, expected",
     [
-        # March 2024 Fridays
+        # March 2024 Fridays (mix of string and int weekday specs)
         (dt.datetime(2024, 3, 1), "friday", 1, dt.datetime(2024, 3, 1)),
-        (dt.datetime(2024, 3, 1), "friday", 2, dt.datetime(2024, 3, 8)),
+        (dt.datetime(2024, 3, 1), _FRIDAY, 2, dt.datetime(2024, 3, 8)),
         (dt.datetime(2024, 3, 1), "friday", -1, dt.datetime(2024, 3, 29)),
-        (dt.datetime(2024, 3, 1), "friday", -2, dt.datetime(2024, 3, 22)),
+        (dt.datetime(2024, 3, 1), _FRIDAY, -2, dt.datetime(2024, 3, 22)),
         # Feb 2024: 5th and -5th Friday do not exist (should raise)
         (dt.datetime(2024, 2, 1), "friday", 5, None),
-        (dt.datetime(2024, 2, 1), "friday", -5, None),
+        (dt.datetime(2024, 2, 1), _FRIDAY, -5, None),
     ],
 )
 def test_month_unit_nth_weekday_param(
     ref_date: dt.datetime,
-    weekday: str,
+    weekday: str | int,
     n: int,
     expected: dt.datetime | None,
 ) -> None:
@@ -65,8 +82,7 @@ def test_month_unit_nth_weekday_param(
     Parametrized test for nth_weekday with positive and negative indexes, including error cases.
     """
     # Arrange
-    cal = Cal(ref_date, ref_date)
-    mn = MonthUnit(cal)
+    mn = _make_month_unit(ref_date, ref_date)
     # Act & Assert
     if expected is not None:
         assert mn.nth_weekday(weekday, n) == expected, (
@@ -102,8 +118,7 @@ def test_monthunit_is_nth_weekday_param(
     AAA: Arrange, Act, Assert.
     """
     # Arrange
-    cal = Cal(target_date, ref_date)
-    mn = MonthUnit(cal)
+    mn = _make_month_unit(target_date, ref_date)
     # Act & Assert
     result = mn.is_nth_weekday(weekday, n)
     assert result is expected, (
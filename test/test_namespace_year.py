@@ -3,6 +3,7 @@ Tests for YearUnit in frist.units._year.py.
 """
 
 import datetime as dt
+import functools
 
 import pytest
 
@@ -10,6 +11,13 @@ from frist import Cal
 from frist.units import YearUnit
 
 
+@functools.lru_cache(maxsize=None)
+def _make_year_unit(target: dt.datetime, ref: dt.datetime) -> YearUnit:
+    """Cached YearUnit factory: parametrize rows repeat target dates, so
+    identical (target, ref) pairs share one Cal/YearUnit construction."""
+    return YearUnit(Cal(target, ref))
+
+
 @pytest.mark.parametrize(
     "target_date, expected_day_of_year",
     [
@@ -25,8 +33,7 @@ def test_year_unit_day_of_year(target_date: dt.datetime,
     Test YearUnit.day_of_year returns correct day of year.
     """
     # Arrange
-    cal = Cal(target_date, target_date)
-    yn = YearUnit(cal)
+    yn = _make_year_unit(target_date, target_date)
     # Act
     actual = yn.day_of_year()
     expected = expected_day_of_year
@@ -50,11 +57,13 @@ def test_year_unit_is_day_of_year(target_date: dt.datetime, n: int, expected: bo
     Test YearUnit.is_day_of_year returns True only for correct day.
     """
     # Arrange
-    cal = Cal(target_date, target_date)
-    yn = YearUnit(cal)
+    yn = _make_year_unit(target_date, target_date)
     # Act
     actual = yn.is_day_of_year(n)
     # Assert
+    # Independent oracle: struct_time's tm_yday must agree with the expected
+    # column, so table errors can't silently match an implementation bug.
+    assert (target_date.timetuple().tm_yday == n) is expected
     msg = (
         f"{target_date:%Y-%m-%d} is_day_of_year({n}): actual={actual}, expected={expected}"
     )
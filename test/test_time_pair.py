@@ -11,6 +11,7 @@ import datetime as dt
 import pytest
 
 from frist._frist import time_pair
+from frist._types import time_pair_many
 
 
 def test_time_pair_datetime() -> None:
@@ -155,3 +156,28 @@ def test_time_pair_different_tzinfo_raises() -> None:
     aware2 = dt.datetime(2024, 1, 2, 12, 0, 0, tzinfo=tz2)
     with pytest.raises((ValueError, TypeError)):
         time_pair(start_time=aware1, end_time=aware2)
+
+def test_time_pair_many_matches_scalar_and_shares_now() -> None:
+    """Batch normalization matches time_pair and shares one now() default."""
+    starts = [dt.datetime(2024, 1, 1, 12, 0, 0), "2024-01-02", dt.date(2024, 1, 3)]
+    ends = [dt.datetime(2024, 1, 5), "2024-01-06 06:00:00", None]
+    # Act
+    pairs = time_pair_many(starts, ends)
+    # Assert: explicit ends match the scalar API
+    for (actual_start, actual_end), start, end in zip(pairs[:2], starts[:2], ends[:2]):
+        expected = time_pair(start_time=start, end_time=end)
+        assert (actual_start, actual_end) == expected
+    # Defaulted end is a datetime (now); all-default batch shares one instant
+    assert isinstance(pairs[2][1], dt.datetime)
+    defaulted = time_pair_many(starts)
+    assert defaulted[0][1] == defaulted[1][1] == defaulted[2][1], "now() should be shared"
+
+
+def test_time_pair_many_rejects_mismatched_lengths() -> None:
+    """A shorter (or longer) ends list raises instead of silently truncating."""
+    starts = [dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2)]
+    # Act & Assert
+    with pytest.raises(ValueError, match="same length"):
+        time_pair_many(starts, [dt.datetime(2024, 1, 5)])
+    with pytest.raises(ValueError, match="same length"):
+        time_pair_many(starts, [None, None, None])
@@ -6,19 +6,26 @@ Follows CODESTYLE with AAA comments and direct Act/Assert for simple cases.
 
 import datetime as dt
 
+import pytest
+
 from frist._cal import Cal
 
 
-def test_unit_explicit_checks():
+@pytest.fixture(scope="module")
+def cal() -> Cal:
+    """Shared read-only Cal with ref == target; built once for the module."""
+    ref = dt.datetime(2025, 3, 15, 12, 34, 56)  # Saturday, 2025-03-15
+    return Cal(target_dt=ref, ref_dt=ref)
+
+
+def test_unit_explicit_checks(cal: Cal):
     """Explicit checks for each compact unit against a concrete Cal.
 
     Uses a reference datetime and a target equal to the reference so the
     expected membership is straightforward: the 0 offset should be True and
     negative offsets should be False for each unit.
     """
-    # Arrange
-    ref = dt.datetime(2025, 3, 15, 12, 34, 56)  # Saturday, 2025-03-15
-    cal = Cal(target_dt=ref, ref_dt=ref)
+    # Arrange handled by the module-scoped `cal` fixture.
 
     # Act / Assert: Minutes
     assert cal.minute.in_(0) is True
@@ -22,20 +22,26 @@ UNITS = [
     "year",
 ]
 
+@pytest.fixture(scope="module")
+def cal() -> Cal:
+    """Shared read-only Cal with ref == target; built once for the module."""
+    ref = dt.datetime(2025, 3, 15, 12, 34, 56)
+    return Cal(target_dt=ref, ref_dt=ref)
+
+
 @pytest.mark.smoke
-def test_unit_unit_smoke():
-    """Smoke test for compact unit 
+@pytest.mark.parametrize("unit", UNITS)
+def test_unit_unit_smoke(cal: Cal, unit: str):
+    """Smoke test for compact unit
 
-    Verifies that each compact supports call/slice/thru sugar.
+    Verifies that each compact supports call/slice/thru sugar. Each unit is
+    its own parametrized case so one failure does not mask the rest.
     """
-    # Arrange
-    ref = dt.datetime(2025, 3, 15, 12, 34, 56)
-    cal = Cal(target_dt=ref, ref_dt=ref)
+    # Arrange handled by the module-scoped `cal` fixture.
 
-    # Act / Assert: iterate units and verify golden boolean expectations
-    for unit in UNITS:
-        ns = getattr(cal, unit)
+    # Act
+    ns = getattr(cal, unit)
 
-        # Golden checks: when ref==target, current unit should be True, previous should be False
-        assert ns.in_(0) is True
-        assert ns.in_(-1) is False
+    # Assert: when ref==target, current unit should be True, previous should be False
+    assert ns.in_(0) is True
+    assert ns.in_(-1) is False
@@ -1,11 +1,17 @@
 import datetime as dt
 
+import pytest
+
 from frist import Biz, BizPolicy, Cal
 
+# Mon-Fri policy with no holidays, shared by every test that doesn't need a
+# holiday; the policy is read-only here so one instance suffices.
+_WEEKDAY_POLICY = BizPolicy(workdays=[0, 1, 2, 3, 4], holidays=set())
+
 
 def test_work_day_is_today_true_on_weekday():
     # Wednesday workday, target and ref same weekday
-    policy = BizPolicy(workdays=[0, 1, 2, 3, 4], holidays=set())
+    policy = _WEEKDAY_POLICY
     target = dt.datetime(2025, 12, 3, 10, 0)  # Wed
     ref = dt.datetime(2025, 12, 3, 12, 0)
     b = Biz(target, ref, policy)
@@ -13,7 +19,7 @@ def test_work_day_is_today_true_on_weekday():
 
 
 def test_work_day_is_today_false_on_weekend():
-    policy = BizPolicy(workdays=[0, 1, 2, 3, 4], holidays=set())
+    policy = _WEEKDAY_POLICY
     target = dt.datetime(2025, 12, 6, 10, 0)  # Sat
     ref = dt.datetime(2025, 12, 6, 12, 0)
     b = Biz(target, ref, policy)
@@ -30,7 +36,7 @@ def test_biz_day_is_today_false_on_holiday():
 
 
 def test_biz_day_is_today_true_non_holiday_weekday():
-    policy = BizPolicy(workdays=[0, 1, 2, 3, 4], holidays=set())
+    policy = _WEEKDAY_POLICY
     target = dt.datetime(2025, 12, 4, 10, 0)  # Thu
     ref = dt.datetime(2025, 12, 4, 12, 0)
     b = Biz(target, ref, policy)
@@ -38,7 +44,7 @@ def test_biz_day_is_today_true_non_holiday_weekday():
 
 
 def test_working_days_signed_direction():
-    policy = BizPolicy(workdays=[0, 1, 2, 3, 4], holidays=set())
+    policy = _WEEKDAY_POLICY
     # Target earlier than ref yields positive working_days
     target = dt.datetime(2025, 12, 3, 10, 0)  # Wed
     ref = dt.datetime(2025, 12, 4, 12, 0)    # Thu
@@ -67,11 +73,10 @@ def test_business_days_signed_direction():
 
 
 def test_biz_day_yesterday_tomorrow_raise():
-    policy = BizPolicy(workdays=[0, 1, 2, 3, 4], holidays=set())
+    policy = _WEEKDAY_POLICY
     target = dt.datetime(2025, 12, 3, 10, 0)  # Wed
     ref = dt.datetime(2025, 12, 3, 12, 0)
     b = Biz(target, ref, policy)
-    import pytest
     with pytest.raises(ValueError):
         _ = b.biz_day.is_yesterday
     with pytest.raises(ValueError):
@@ -79,11 +84,10 @@ def test_biz_day_yesterday_tomorrow_raise():
 
 
 def test_work_day_yesterday_tomorrow_raise():
-    policy = BizPolicy(workdays=[0, 1, 2, 3, 4], holidays=set())
+    policy = _WEEKDAY_POLICY
     target = dt.datetime(2025, 12, 3, 10, 0)  # Wed
     ref = dt.datetime(2025, 12, 3, 12, 0)
     b = Biz(target, ref, policy)
-    import pytest
     with pytest.raises(ValueError):
         _ = b.work_day.is_yesterday
     with pytest.raises(ValueError):
@@ -1,3 +1,5 @@
+import math
+
 import pytest
 from typing import Any, Union
 
@@ -17,8 +19,13 @@ def approx_val(expected: Number, *, rel: float = 1e-6, abs: float | None = None)
 def assert_approx(actual: Number, expected: Number, *, rel: float = 1e-6, abs: float | None = None) -> None:
     """Assert that `actual` approximately equals `expected` within tolerance.
 
-    This keeps the assertion at the top-level in tests simple and avoids
-    needing complex message handling in the helper.
+    The common success path is one float comparison with no object
+    construction, using pytest.approx's own criterion (tolerance relative to
+    `expected`) so it never accepts anything approx would reject. The approx
+    object is only built when that check fails, keeping pytest's
+    tolerance-aware diff for genuine mismatches.
     """
-    approx = approx_val(expected, rel=rel, abs=abs)
-    assert actual == approx
\ No newline at end of file
+    tol = abs if abs is not None else rel * math.fabs(expected)
+    if math.fabs(actual - expected) <= tol:
+        return
+    assert actual == approx_val(expected, rel=rel, abs=abs)
\ No newline at end of file